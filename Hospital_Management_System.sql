@@ -3,6 +3,10 @@ USE master
 CREATE DATABASE Hospital;
 GO
 
+-- Row versioning lets READ COMMITTED reads run without blocking writers
+ALTER DATABASE Hospital SET READ_COMMITTED_SNAPSHOT ON;
+GO
+
 USE Hospital;
 GO
 
@@ -132,6 +136,21 @@ CREATE TABLE Notifications (
     PRIMARY KEY ("Notification_ID")
 );
 
+-- Indexes backing the lookups by doctor, patient, staff, speciality, status and recipient
+CREATE INDEX ix_shift_staff ON StaffShifts (Staff_ID);
+CREATE INDEX ix_test_patient ON Test_Records (Patient_ID);
+CREATE INDEX ix_appt_doc_date ON Appointments (Doc_ID, Appointment_Date);
+CREATE INDEX ix_appt_patient ON Appointments (Patient_ID);
+CREATE INDEX ix_appt_spec ON Appointments (Speciality);
+CREATE INDEX ix_mh_doc ON MedicalHistory (Doc_ID);
+CREATE INDEX ix_mh_patient ON MedicalHistory (Patient_ID);
+CREATE INDEX ix_bed_status ON Beds (Status);
+CREATE INDEX ix_bed_patient ON Beds (Patient_ID);
+CREATE INDEX ix_rx_doc ON Prescriptions (Doctor_ID);
+CREATE INDEX ix_rx_patient ON Prescriptions (Patient_ID);
+CREATE INDEX ix_rx_detail_rx ON Prescription_Details (Prescription_ID);
+CREATE INDEX ix_notif_recipient ON Notifications (Recipient_Type, Recipient_ID, Status);
+
 INSERT INTO Doctors (Doc_Name, Speciality, Phone_Num, Email)
 VALUES 
 ('Dr. John Smith', 'Cardiologist', '123-456-7890', 'john.smith@hospital.com'),
@@ -0,0 +1,63 @@
+"""
+Database driver benchmark for the Hospital Management System.
+
+Runs `SELECT 1` repeatedly through each SQLAlchemy URL given on the command
+line and reports the per-query latency, so the fastest installed driver
+(e.g. mssql+pyodbc vs mssql+pymssql) can be chosen for DB_URL.
+
+Usage:
+    python db_benchmark.py "mssql+pyodbc://..." "mssql+pymssql://..." [-n 10000]
+"""
+
+import argparse
+import time
+from sqlalchemy import create_engine, text
+
+
+def benchmark(url, iterations):
+    """
+    Time `iterations` round-trips of `SELECT 1` on a single connection.
+
+    Args:
+        url (str): SQLAlchemy database URL.
+        iterations (int): Number of queries to run.
+
+    Returns:
+        float: Average seconds per query.
+    """
+    engine = create_engine(url)
+    try:
+        with engine.connect() as conn:
+            stmt = text("SELECT 1")
+            conn.execute(stmt).scalar()
+            start = time.perf_counter()
+            for _ in range(iterations):
+                conn.execute(stmt).scalar()
+            return (time.perf_counter() - start) / iterations
+    finally:
+        engine.dispose()
+
+
+def main():
+    '''
+    Main Method
+    '''
+    parser = argparse.ArgumentParser(description="Compare database drivers with SELECT 1 round-trips.")
+    parser.add_argument("urls", nargs="+", help="SQLAlchemy URLs to compare")
+    parser.add_argument("-n", "--iterations", type=int, default=10000)
+    args = parser.parse_args()
+
+    results = {}
+    for url in args.urls:
+        try:
+            results[url] = benchmark(url, args.iterations)
+            print(f"{url}: {results[url] * 1e6:.1f} us/query")
+        except Exception as e:
+            print(f"{url}: failed ({e})")
+
+    if results:
+        print("Fastest:", min(results, key=results.get))
+
+
+if __name__ == '__main__':
+    main()
@@ -24,16 +24,297 @@ Modules Required:
 - typing: Provides type hints for better code clarity.
 
 """
+import contextlib
+from contextvars import ContextVar
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.engine import Result
+from sqlalchemy import String, and_, bindparam, case, cast, delete, exists, func, insert, lambda_stmt, literal, select, update
 from models import Doctor, Staff, StaffShift, Patient, TestRecord, Appointment, MedicalHistory, Bed, Prescription, PrescriptionDetail, Notification
 
 from schemas import DoctorCreate, StaffCreate, StaffShiftCreate, PatientCreate, TestRecordCreate, AppointmentCreate, MedicalHistoryCreate, BedCreate, PrescriptionCreate, PrescriptionDetailCreate, NotificationCreate
+from schemas import BedStatus, RecipientType
+
+
+# Statements built once at import; callers only bind new parameter values,
+# so every call hits the engine's compiled-statement cache.
+# Rows fetched per batch by the streamed appointment/history listings
+_STREAM_CHUNK = 500
+_APPOINTMENT_COLUMNS = (
+    Appointment.Appointment_ID,
+    Appointment.Appointment_Date,
+    Appointment.Statusof,
+    Appointment.Typeof,
+    Appointment.Speciality,
+    Appointment.Notes,
+)
+_HISTORY_COLUMNS = select(
+    MedicalHistory.History_ID,
+    MedicalHistory.Diagnosis,
+    MedicalHistory.Treatment,
+    MedicalHistory.Record_Date,
+    Doctor.Doc_Name,
+    Patient.Patient_Name
+).join(Doctor, MedicalHistory.Doc_ID == Doctor.Doc_ID)\
+ .join(Patient, MedicalHistory.Patient_ID == Patient.Patient_ID)
+
+_DOCTOR_EXISTS = select(literal(1)).where(Doctor.Doc_ID == bindparam("id"))
+_STAFF_MEMBER_EXISTS = select(literal(1)).where(Staff.Staff_ID == bindparam("id"))
+_PATIENT_EXISTS = select(literal(1)).where(Patient.Patient_ID == bindparam("id"))
+_GET_PATIENT_NAME = select(Patient.Patient_Name).where(Patient.Patient_ID == bindparam("id"))
+# Always one row: the doctor (or NULLs) next to a patient-exists flag; SQL Server has no bare EXISTS column
+_FIND_DOCTOR_AND_PATIENT = (
+    select(Doctor, case((exists().where(Patient.Patient_ID == bindparam("patient_id")), True), else_=False))
+    .select_from(select(literal(1)).subquery())
+    .outerjoin(Doctor, Doctor.Doc_ID == bindparam("doctor_id"))
+)
+_GET_DOCTORS = select(Doctor)
+_GET_STAFF = select(Staff)
+_GET_STAFF_SHIFTS = select(StaffShift)
+_GET_STAFF_SHIFTS_BY_STAFF = select(StaffShift).where(StaffShift.Staff_ID == bindparam("id"))
+_GET_APPOINTMENTS_BY_DOCTOR = select(*_APPOINTMENT_COLUMNS).where(Appointment.Doc_ID == bindparam("id"))\
+    .execution_options(yield_per=_STREAM_CHUNK)
+_GET_APPOINTMENTS_BY_SPECIALITY = select(*_APPOINTMENT_COLUMNS).where(Appointment.Speciality == bindparam("speciality"))
+_GET_APPOINTMENTS_BY_PATIENT = select(*_APPOINTMENT_COLUMNS).where(Appointment.Patient_ID == bindparam("id"))\
+    .execution_options(yield_per=_STREAM_CHUNK)
+_GET_HISTORY_BY_DOCTOR = _HISTORY_COLUMNS.where(MedicalHistory.Doc_ID == bindparam("id"))\
+    .execution_options(yield_per=_STREAM_CHUNK)
+_GET_HISTORY_BY_PATIENT = _HISTORY_COLUMNS.where(MedicalHistory.Patient_ID == bindparam("id"))\
+    .execution_options(yield_per=_STREAM_CHUNK)
+_GET_BEDS_BY_STATUS = select(Bed).where(Bed.Status == bindparam("status"))
+_COUNT_BEDS_BY_STATUS = select(Bed.Status, func.count(Bed.Bed_ID)).group_by(Bed.Status)
+_GET_PRESCRIPTION_WITH_DETAILS = select(Prescription).where(Prescription.Prescription_ID == bindparam("id"))\
+    .options(selectinload(Prescription.details))
+_PRESCRIPTION_COLUMNS = select(
+    Prescription.Prescription_ID,
+    Doctor.Doc_Name,
+    Patient.Patient_Name,
+    Prescription.Date_Issued,
+    Prescription.Notes,
+    PrescriptionDetail.Medication_Name,
+    PrescriptionDetail.Dosage,
+    PrescriptionDetail.Frequency,
+    PrescriptionDetail.Duration
+).join(Doctor, Prescription.Doctor_ID == Doctor.Doc_ID)\
+ .join(Patient, Prescription.Patient_ID == Patient.Patient_ID)\
+ .join(PrescriptionDetail, Prescription.Prescription_ID == PrescriptionDetail.Prescription_ID)
+_GET_PRESCRIPTIONS_BY = {
+    "prescription": _PRESCRIPTION_COLUMNS.where(Prescription.Prescription_ID == bindparam("value")),
+    "doctor": _PRESCRIPTION_COLUMNS.where(Prescription.Doctor_ID == bindparam("value")),
+    "patient": _PRESCRIPTION_COLUMNS.where(Prescription.Patient_ID == bindparam("value")),
+}
+_MARK_UNREAD_AS_READ = update(Notification).where(Notification.Status == 'Unread')\
+    .values(Status='Read', Read_At=func.now())
+# "fetch" refreshes notifications already loaded in the session (expire_on_commit=False)
+_MARK_NOTIFICATION_AS_READ = _MARK_UNREAD_AS_READ\
+    .where(Notification.Notification_ID == bindparam("id")).returning(Notification)\
+    .execution_options(synchronize_session="fetch")
+_MARK_NOTIFICATIONS_AS_READ = _MARK_UNREAD_AS_READ\
+    .where(Notification.Notification_ID.in_(bindparam("ids", expanding=True)))\
+    .execution_options(synchronize_session="fetch")
+_GET_NOTIFICATIONS_FOR_RECIPIENT = select(Notification).where(
+    Notification.Recipient_Type == bindparam("recipient_type"),
+    Notification.Recipient_ID == bindparam("recipient_id")
+)
+
+
+# Set while inside commit_once(); the CRUDs then only flush
+_no_commit: ContextVar[bool] = ContextVar("_no_commit", default=False)
+
+
+def _commit(db: Session):
+    if _no_commit.get():
+        db.flush()
+    else:
+        db.commit()
+
+
+@contextlib.contextmanager
+def commit_once(db: Session):
+    """
+    Coalesce the CRUD calls made inside the block into a single transaction.
+
+    The operations of this module only flush while the block runs; one
+    commit is issued at the end, or everything is rolled back on error.
+
+    Args:
+        db (Session): Database session shared by the wrapped calls.
+
+    Yields:
+        db (Session): The same session.
+
+    Example:
+        with commit_once(db):
+            prescription = create_prescription(db, data)
+            create_prescription_detail(db, detail)
+    """
+    if _no_commit.get():
+        # Nested inside another block, which commits or rolls back for both
+        yield db
+        return
+    token = _no_commit.set(True)
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        _no_commit.reset(token)
+
+
+def _bulk_insert(db: Session, model, rows: List[dict]) -> list:
+    """
+    Insert many rows of `model` in one statement and one transaction.
+
+    Args:
+        db (Session): Database session.
+        model: Mapped class to insert into.
+        rows (List[dict]): Column values of each new row.
+
+    Returns:
+        list: The created records, in the order of `rows`.
+    """
+    if not rows:
+        return []
+    created = list(db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows))
+    _commit(db)
+    return created
+
+
+def _update_by_pk(db: Session, model, pk_column, pk, values: dict):
+    """
+    Update one row with a single UPDATE ... RETURNING statement.
+
+    Args:
+        db (Session): Database session.
+        model: Mapped class to update.
+        pk_column: Primary key column of `model`.
+        pk: Primary key value of the row.
+        values (dict): Column values to set.
+
+    Returns:
+        The updated record, if found; otherwise, None.
+    """
+    if not values:
+        return db.get(model, pk)
+    row = db.scalars(update(model).where(pk_column == pk).values(**values).returning(model)).one_or_none()
+    _commit(db)
+    return row
+
+
+def _delete_by_pk(db: Session, model, pk_column, pk):
+    """
+    Delete one row with a single DELETE ... RETURNING statement.
+
+    Args:
+        db (Session): Database session.
+        model: Mapped class to delete from.
+        pk_column: Primary key column of `model`.
+        pk: Primary key value of the row.
+
+    Returns:
+        The deleted record, if found; otherwise, None.
+    """
+    row = db.scalars(delete(model).where(pk_column == pk).returning(model)).one_or_none()
+    _commit(db)
+    return row
+
+
+def _insert_if_absent(db: Session, model, values: dict, match: List[str]):
+    """
+    Insert a row unless one with the same `match` columns already exists.
+
+    Runs as a single INSERT ... SELECT ... WHERE NOT EXISTS ... RETURNING, so
+    retried calls are idempotent without a separate SELECT probe. On SQL Server
+    the probe takes UPDLOCK, HOLDLOCK so overlapping retries serialize on the
+    matched key range instead of both inserting; SQLite already serializes writers.
+
+    Args:
+        db (Session): Database session.
+        model: Mapped class to insert into.
+        values (dict): Column values of the new row.
+        match (List[str]): Columns that identify a duplicate.
+
+    Returns:
+        The created record, or None if a matching row already existed.
+    """
+    table = model.__table__
+    conditions = []
+    for name in match:
+        column = table.c[name]
+        # Unbounded strings map to TEXT columns, which SQL Server cannot compare with =
+        if isinstance(column.type, String) and column.type.length is None:
+            column = cast(column, String)
+        conditions.append(column == values[name])
+    probe = select(literal(1)).select_from(table).where(and_(*conditions))\
+        .with_hint(table, "WITH (UPDLOCK, HOLDLOCK)", "mssql")
+    source = select(*[literal(value, table.c[name].type).label(name) for name, value in values.items()])\
+        .where(~probe.exists())
+    row = db.scalars(insert(model).from_select(list(values), source).returning(model)).one_or_none()
+    _commit(db)
+    return row
+
+
+def _page(db: Session, model, pk_column, after_id: int, limit: Optional[int]) -> list:
+    """
+    Fetch the next page of `model` rows in primary key order (keyset pagination).
+
+    Args:
+        db (Session): Database session.
+        model: Mapped class to list.
+        pk_column: Primary key column of `model`.
+        after_id (int): Only rows with a greater primary key are returned.
+        limit (Optional[int]): Page size; None returns every remaining row.
+
+    Returns:
+        list: The records of the page.
+    """
+    # Lambda statements are cached on their code location, skipping statement construction per page
+    stmt = lambda_stmt(lambda: select(model).where(pk_column > after_id).order_by(pk_column))
+    if limit is not None:
+        stmt += lambda s: s.limit(limit)
+    return db.scalars(stmt).all()
+
+
+async def run_async(db: AsyncSession, operation: Callable[..., Any], *args) -> Any:
+    """
+    Run any CRUD operation of this module on an async session.
+
+    The operation executes through the async driver, so an `async def`
+    endpoint awaits the database instead of blocking the event loop.
+
+    Args:
+        db (AsyncSession): Async database session, e.g. from database.get_async_db.
+        operation (Callable): CRUD function of this module, e.g. get_doctor.
+        *args: Arguments after the session.
+
+    Returns:
+        Any: Whatever `operation` returns.
+
+    Example:
+        doctor = await run_async(db, get_doctor, doctor_id)
+    """
+    return await db.run_sync(operation, *args)
 
 
 # Doctor API 
+def get_doctor(db: Session, doctor_id: int) -> Optional[Doctor]:
+    """
+    Retrieve a specific doctor by ID.
+
+    Args:
+        db (Session): Database session.
+        doctor_id (int): ID of the doctor to retrieve.
+
+    Returns:
+        Optional[Doctor]: The doctor record, if found; otherwise, None.
+    """
+    return db.get(Doctor, doctor_id)
+
+
 def create_doctor(db: Session, doctor: DoctorCreate) -> Doctor:
     """
     Create a new doctor in the database.
@@ -45,13 +326,27 @@ def create_doctor(db: Session, doctor: DoctorCreate) -> Doctor:
     Returns:
         Doctor: The newly created doctor record.
     """
-    db_doctor = Doctor(**doctor.dict())
+    db_doctor = Doctor(**doctor.model_dump())
     db.add(db_doctor)
-    db.commit()
+    _commit(db)
     db.refresh(db_doctor)
     return db_doctor
 
 
+def bulk_create_doctors(db: Session, doctors: List[DoctorCreate]) -> List[Doctor]:
+    """
+    Create many doctors with a single INSERT.
+
+    Args:
+        db (Session): Database session.
+        doctors (List[DoctorCreate]): Data for the new doctors.
+
+    Returns:
+        List[Doctor]: The newly created records.
+    """
+    return _bulk_insert(db, Doctor, [item.model_dump() for item in doctors])
+
+
 def get_doctors(db: Session) -> List[Doctor]:
     """
     Retrieve all doctors from the database.
@@ -62,21 +357,21 @@ def get_doctors(db: Session) -> List[Doctor]:
     Returns:
         List[Doctor]: A list of all doctors.
     """
-    return db.query(Doctor).all()
+    return db.scalars(_GET_DOCTORS).all()
 
 
-def get_doctor(db: Session, doctor_id: int) -> Optional[Doctor]:
+def doctor_exists(db: Session, doctor_id: int) -> bool:
     """
-    Retrieve a specific doctor by ID.
+    Check whether a doctor exists without loading the record.
 
     Args:
         db (Session): Database session.
-        doctor_id (int): ID of the doctor to retrieve.
+        doctor_id (int): ID of the doctor to look for.
 
     Returns:
-        Optional[Doctor]: The doctor record, if found; otherwise, None.
+        bool: True if the doctor exists.
     """
-    return db.query(Doctor).filter(Doctor.Doc_ID == doctor_id).first()
+    return db.execute(_DOCTOR_EXISTS, {"id": doctor_id}).first() is not None
 
 
 def update_doctor(db: Session, doctor_id: int, doctor: DoctorCreate) -> Optional[Doctor]:
@@ -91,13 +386,7 @@ def update_doctor(db: Session, doctor_id: int, doctor: DoctorCreate) -> Optional
     Returns:
         Optional[Doctor]: The updated doctor record, if found; otherwise, None.
     """
-    db_doctor = get_doctor(db, doctor_id)
-    if db_doctor:
-        for key, value in doctor.dict().items():
-            setattr(db_doctor, key, value)
-        db.commit()
-        db.refresh(db_doctor)
-    return db_doctor
+    return _update_by_pk(db, Doctor, Doctor.Doc_ID, doctor_id, doctor.model_dump(exclude_unset=True))
 
 
 def delete_doctor(db: Session, doctor_id: int) -> Optional[Doctor]:
@@ -114,11 +403,25 @@ def delete_doctor(db: Session, doctor_id: int) -> Optional[Doctor]:
     db_doctor = get_doctor(db, doctor_id)
     if db_doctor:
         db.delete(db_doctor)
-        db.commit()
+        _commit(db)
     return db_doctor
 
 
 # Staff API
+def get_staff_member(db: Session, staff_id: int) -> Optional[Staff]:
+    """
+    Retrieve a specific staff member by ID.
+
+    Args:
+        db (Session): Database session.
+        staff_id (int): ID of the staff member to retrieve.
+
+    Returns:
+        Optional[Staff]: The staff record, if found; otherwise, None.
+    """
+    return db.get(Staff, staff_id)
+
+
 def create_staff(db: Session, staff: StaffCreate) -> Staff:
     """
     Create a new staff member in the database.
@@ -130,38 +433,38 @@ def create_staff(db: Session, staff: StaffCreate) -> Staff:
     Returns:
         Staff: The newly created staff record.
     """
-    db_staff = Staff(**staff.dict())
+    db_staff = Staff(**staff.model_dump())
     db.add(db_staff)
-    db.commit()
+    _commit(db)
     db.refresh(db_staff)
     return db_staff
 
 
-def get_staff(db: Session) -> List[Staff]:
+def bulk_create_staff(db: Session, staff: List[StaffCreate]) -> List[Staff]:
     """
-    Retrieve all staff members from the database.
+    Create many staff members with a single INSERT.
 
     Args:
         db (Session): Database session.
+        staff (List[StaffCreate]): Data for the new staff members.
 
     Returns:
-        List[Staff]: A list of all staff members.
+        List[Staff]: The newly created records.
     """
-    return db.query(Staff).all()
+    return _bulk_insert(db, Staff, [item.model_dump() for item in staff])
 
 
-def get_staff_member(db: Session, staff_id: int) -> Optional[Staff]:
+def get_staff(db: Session) -> List[Staff]:
     """
-    Retrieve a specific staff member by ID.
+    Retrieve all staff members from the database.
 
     Args:
         db (Session): Database session.
-        staff_id (int): ID of the staff member to retrieve.
 
     Returns:
-        Optional[Staff]: The staff record, if found; otherwise, None.
+        List[Staff]: A list of all staff members.
     """
-    return db.query(Staff).filter(Staff.Staff_ID == staff_id).first()
+    return db.scalars(_GET_STAFF).all()
 
 
 def update_staff(db: Session, staff_id: int, staff: StaffCreate) -> Optional[Staff]:
@@ -176,21 +479,38 @@ def update_staff(db: Session, staff_id: int, staff: StaffCreate) -> Optional[Sta
     Returns:
         Optional[Staff]: The updated staff record, if found; otherwise, None.
     """
-    db_staff = get_staff_member(db, staff_id)
-    if db_staff:
-        for key, value in staff.dict().items():
-            setattr(db_staff, key, value)
-        db.commit()
-        db.refresh(db_staff)
-    return db_staff
+    return _update_by_pk(db, Staff, Staff.Staff_ID, staff_id, staff.model_dump(exclude_unset=True))
+
+
+def staff_member_exists(db: Session, staff_id: int) -> bool:
+    """
+    Check whether a staff member exists without loading the record.
+
+    Args:
+        db (Session): Database session.
+        staff_id (int): ID of the staff member to look for.
+
+    Returns:
+        bool: True if the staff member exists.
+    """
+    return db.execute(_STAFF_MEMBER_EXISTS, {"id": staff_id}).first() is not None
 
 
 def delete_staff(db: Session, staff_id: int) -> Optional[Staff]:
+    """
+    Delete a staff member from the database.
 
+    Args:
+        db (Session): Database session.
+        staff_id (int): ID of the staff member to delete.
+
+    Returns:
+        Optional[Staff]: The deleted staff record, if found; otherwise, None.
+    """
     db_staff = get_staff_member(db, staff_id)
     if db_staff:
         db.delete(db_staff)
-        db.commit()
+        _commit(db)
     return db_staff
 
 
@@ -206,87 +526,94 @@ def create_staff_shift(db: Session, staff_shift: StaffShiftCreate) -> StaffShift
     Returns:
         StaffShift: The newly created staff shift record.
     """
-    db_staff_shift = StaffShift(**staff_shift.dict())
+    db_staff_shift = StaffShift(**staff_shift.model_dump())
     db.add(db_staff_shift)
-    db.commit()
+    _commit(db)
     db.refresh(db_staff_shift)
     return db_staff_shift
 
-def get_staff_shifts(db: Session) -> List[StaffShift]:
+
+def get_staff_shift(db: Session, shift_id: int) -> Optional[StaffShift]:
     """
-    Retrieve all staff shifts from the database.
+    Retrieve a specific staff shift by ID.
 
     Args:
         db (Session): Database session.
+        shift_id (int): ID of the staff shift to retrieve.
 
     Returns:
-        List[StaffShift]: A list of all staff shifts.
+        Optional[StaffShift]: The staff shift record, if found; otherwise, None.
     """
-    return db.query(StaffShift).all()
+    return db.get(StaffShift, shift_id)
 
-def get_staff_shift(db: Session, shift_id: int) -> Optional[StaffShift]:
+
+def update_staff_shift(db: Session, shift_id: int, staff_shift: StaffShiftCreate) -> Optional[StaffShift]:
     """
-    Retrieve a specific staff shift by ID.
+    Update an existing staff shift's details.
 
     Args:
         db (Session): Database session.
-        shift_id (int): ID of the staff shift to retrieve.
+        shift_id (int): ID of the staff shift to update.
+        staff_shift (StaffShiftCreate): Updated staff shift data.
 
     Returns:
-        Optional[StaffShift]: The staff shift record, if found; otherwise, None.
+        Optional[StaffShift]: The updated staff shift record, if found; otherwise, None.
     """
-    return db.query(StaffShift).filter(StaffShift.Shift_ID == shift_id).first()
+    return _update_by_pk(db, StaffShift, StaffShift.Shift_ID, shift_id, staff_shift.model_dump(exclude_unset=True))
 
-def get_staff_shift_by_staff_id(db: Session, staff_id: int) -> Optional[StaffShift]:
+
+def delete_staff_shift(db: Session, shift_id: int) -> Optional[StaffShift]:
     """
-    Retrieve a specific staff shift by staff ID.
+    Delete a staff shift from the database.
 
     Args:
         db (Session): Database session.
-        staff_id (int): ID of the staff to retrieve.
+        shift_id (int): ID of the staff shift to delete.
 
     Returns:
-        Optional[StaffShift]: The staff shift record, if found; otherwise, None.
+        Optional[StaffShift]: The deleted staff shift record, if found; otherwise, None.
     """
-    return db.query(StaffShift).filter(StaffShift.Staff_ID == staff_id).all()
+    return _delete_by_pk(db, StaffShift, StaffShift.Shift_ID, shift_id)
 
-def update_staff_shift(db: Session, shift_id: int, staff_shift: StaffShiftCreate) -> Optional[StaffShift]:
+
+def create_staff_shift_once(db: Session, staff_shift: StaffShiftCreate) -> Optional[StaffShift]:
     """
-    Update an existing staff shift's details.
+    Create a staff shift unless the staff member already has a shift starting at the same time.
 
     Args:
         db (Session): Database session.
-        shift_id (int): ID of the staff shift to update.
-        staff_shift (StaffShiftCreate): Updated staff shift data.
+        staff_shift (StaffShiftCreate): Data for creating a new staff shift.
 
     Returns:
-        Optional[StaffShift]: The updated staff shift record, if found; otherwise, None.
+        Optional[StaffShift]: The created staff shift, or None if it already existed.
     """
-    db_staff_shift = get_staff_shift(db, shift_id)
-    if db_staff_shift:
-        for key, value in staff_shift.dict().items():
-            setattr(db_staff_shift, key, value)
-        db.commit()
-        db.refresh(db_staff_shift)
-    return db_staff_shift
+    return _insert_if_absent(db, StaffShift, staff_shift.model_dump(), ["Staff_ID", "Shift_Start"])
 
-def delete_staff_shift(db: Session, shift_id: int) -> Optional[StaffShift]:
+
+def get_staff_shifts(db: Session) -> List[StaffShift]:
     """
-    Delete a staff shift from the database.
+    Retrieve all staff shifts from the database.
 
     Args:
         db (Session): Database session.
-        shift_id (int): ID of the staff shift to delete.
 
     Returns:
-        Optional[StaffShift]: The deleted staff shift record, if found; otherwise, None.
+        List[StaffShift]: A list of all staff shifts.
     """
-    db_staff_shift = get_staff_shift(db, shift_id)
-    if db_staff_shift:
-        db.delete(db_staff_shift)
-        db.commit()
-    return db_staff_shift
+    return db.scalars(_GET_STAFF_SHIFTS).all()
 
+def get_staff_shift_by_staff_id(db: Session, staff_id: int) -> Optional[StaffShift]:
+    """
+    Retrieve a specific staff shift by staff ID.
+
+    Args:
+        db (Session): Database session.
+        staff_id (int): ID of the staff to retrieve.
+
+    Returns:
+        Optional[StaffShift]: The staff shift record, if found; otherwise, None.
+    """
+    return db.scalars(_GET_STAFF_SHIFTS_BY_STAFF, {"id": staff_id}).all()
 
 # Patient API
 def create_patient(db: Session, patient: PatientCreate) -> Patient:
@@ -300,24 +627,42 @@ def create_patient(db: Session, patient: PatientCreate) -> Patient:
     Returns:
         Patient: The newly created patient record.
     """
-    db_patient = Patient(**patient.dict())
+    db_patient = Patient(**patient.model_dump())
     db.add(db_patient)
-    db.commit()
+    _commit(db)
     db.refresh(db_patient)
     return db_patient
 
 
-def get_patients(db: Session) -> List[Patient]:
+def bulk_create_patients(db: Session, patients: List[PatientCreate]) -> List[Patient]:
+    """
+    Create many patients with a single INSERT.
+
+    Args:
+        db (Session): Database session.
+        patients (List[PatientCreate]): Data for the new patients.
+
+    Returns:
+        List[Patient]: The newly created records.
+    """
+    return _bulk_insert(db, Patient, [item.model_dump() for item in patients])
+
+
+def get_patients(db: Session, after_id: int = 0, limit: Optional[int] = 100) -> List[Patient]:
     """
-    Retrieve all patients from the database.
+    Retrieve a page of patients from the database, ordered by ID.
+
+    Pass the ID of the last record returned as `after_id` to get the next page.
 
     Args:
         db (Session): Database session.
+        after_id (int): Return only records with a greater ID.
+        limit (Optional[int]): Page size; None returns all remaining records.
 
     Returns:
-        List[Patient]: A list of all patients.
+        List[Patient]: A page of patients.
     """
-    return db.query(Patient).all()
+    return _page(db, Patient, Patient.Patient_ID, after_id, limit)
 
 
 def get_patient(db: Session, patient_id: int) -> Optional[Patient]:
@@ -331,7 +676,7 @@ def get_patient(db: Session, patient_id: int) -> Optional[Patient]:
     Returns:
         Optional[Patient]: The patient record, if found; otherwise, None.
     """
-    return db.query(Patient).filter(Patient.Patient_ID == patient_id).first()
+    return db.get(Patient, patient_id)
 
 
 def update_patient(db: Session, patient_id: int, patient: PatientCreate) -> Optional[Patient]:
@@ -346,15 +691,52 @@ def update_patient(db: Session, patient_id: int, patient: PatientCreate) -> Opti
     Returns:
         Optional[Patient]: The updated patient record, if found; otherwise, None.
     """
-    db_patient = get_patient(db, patient_id)
-    if db_patient:
-        for key, value in patient.dict().items():
-            setattr(db_patient, key, value)
-        db.commit()
-        db.refresh(db_patient)
-    return db_patient
+    return _update_by_pk(db, Patient, Patient.Patient_ID, patient_id, patient.model_dump(exclude_unset=True))
+
+
+def patient_exists(db: Session, patient_id: int) -> bool:
+    """
+    Check whether a patient exists without loading the record.
+
+    Args:
+        db (Session): Database session.
+        patient_id (int): ID of the patient to look for.
+
+    Returns:
+        bool: True if the patient exists.
+    """
+    return db.execute(_PATIENT_EXISTS, {"id": patient_id}).first() is not None
+
+
+def get_patient_name(db: Session, patient_id: int) -> Optional[str]:
+    """
+    Retrieve only a patient's name, without loading the full record.
+
+    Args:
+        db (Session): Database session.
+        patient_id (int): ID of the patient to look for.
+
+    Returns:
+        Optional[str]: The patient's name, if found; otherwise, None.
+    """
+    return db.scalar(_GET_PATIENT_NAME, {"id": patient_id})
 
 
+def find_doctor_and_patient(db: Session, doctor_id: int, patient_id: int) -> Tuple[Optional[Doctor], bool]:
+    """
+    Validate a doctor and a patient ID in one round trip.
+
+    Args:
+        db (Session): Database session.
+        doctor_id (int): ID of the doctor to load.
+        patient_id (int): ID of the patient to look for.
+
+    Returns:
+        Tuple[Optional[Doctor], bool]: The doctor (None if not found) and whether the patient exists.
+    """
+    doctor, patient_found = db.execute(_FIND_DOCTOR_AND_PATIENT, {"doctor_id": doctor_id, "patient_id": patient_id}).one()
+    return doctor, bool(patient_found)
+
 def delete_patient(db: Session, patient_id: int) -> Optional[Patient]:
     """
     Delete a patient from the database.
@@ -369,7 +751,7 @@ def delete_patient(db: Session, patient_id: int) -> Optional[Patient]:
     db_patient = get_patient(db, patient_id)
     if db_patient:
         db.delete(db_patient)
-        db.commit()
+        _commit(db)
     return db_patient
 
 
@@ -385,24 +767,42 @@ def create_test_record(db: Session, test_record: TestRecordCreate) -> TestRecord
     Returns:
         TestRecord: The newly created test record.
     """
-    db_test_record = TestRecord(**test_record.dict())
+    db_test_record = TestRecord(**test_record.model_dump())
     db.add(db_test_record)
-    db.commit()
+    _commit(db)
     db.refresh(db_test_record)
     return db_test_record
 
 
-def get_test_records(db: Session) -> List[TestRecord]:
+def bulk_create_test_records(db: Session, test_records: List[TestRecordCreate]) -> List[TestRecord]:
+    """
+    Create many test records with a single INSERT.
+
+    Args:
+        db (Session): Database session.
+        test_records (List[TestRecordCreate]): Data for the new test records.
+
+    Returns:
+        List[TestRecord]: The newly created records.
+    """
+    return _bulk_insert(db, TestRecord, [item.model_dump() for item in test_records])
+
+
+def get_test_records(db: Session, after_id: int = 0, limit: Optional[int] = 100) -> List[TestRecord]:
     """
-    Retrieve all test records from the database.
+    Retrieve a page of test records from the database, ordered by ID.
+
+    Pass the ID of the last record returned as `after_id` to get the next page.
 
     Args:
         db (Session): Database session.
+        after_id (int): Return only records with a greater ID.
+        limit (Optional[int]): Page size; None returns all remaining records.
 
     Returns:
-        List[TestRecord]: A list of all test records.
+        List[TestRecord]: A page of test records.
     """
-    return db.query(TestRecord).all()
+    return _page(db, TestRecord, TestRecord.Record_ID, after_id, limit)
 
 
 def get_test_record(db: Session, record_id: int) -> Optional[TestRecord]:
@@ -416,7 +816,7 @@ def get_test_record(db: Session, record_id: int) -> Optional[TestRecord]:
     Returns:
         Optional[TestRecord]: The test record, if found; otherwise, None.
     """
-    return db.query(TestRecord).filter(TestRecord.Record_ID == record_id).first()
+    return db.get(TestRecord, record_id)
 
 
 def update_test_record(db: Session, record_id: int, test_record: TestRecordCreate) -> Optional[TestRecord]:
@@ -431,13 +831,7 @@ def update_test_record(db: Session, record_id: int, test_record: TestRecordCreat
     Returns:
         Optional[TestRecord]: The updated test record, if found; otherwise, None.
     """
-    db_test_record = get_test_record(db, record_id)
-    if db_test_record:
-        for key, value in test_record.dict().items():
-            setattr(db_test_record, key, value)
-        db.commit()
-        db.refresh(db_test_record)
-    return db_test_record
+    return _update_by_pk(db, TestRecord, TestRecord.Record_ID, record_id, test_record.model_dump(exclude_unset=True))
 
 
 def delete_test_record(db: Session, record_id: int) -> Optional[TestRecord]:
@@ -451,57 +845,71 @@ def delete_test_record(db: Session, record_id: int) -> Optional[TestRecord]:
     Returns:
         Optional[TestRecord]: The deleted test record, if found; otherwise, None.
     """
-    db_test_record = get_test_record(db, record_id)
-    if db_test_record:
-        db.delete(db_test_record)
-        db.commit()
-    return db_test_record
+    return _delete_by_pk(db, TestRecord, TestRecord.Record_ID, record_id)
 
 
 # Appointment API
-def create_appointment(db: Session, appointment: AppointmentCreate) -> Appointment:
+def get_appointments(db: Session, after_id: int = 0, limit: Optional[int] = 100) -> List[Appointment]:
     """
-    Create a new appointment in the database.
+    Retrieve a page of appointments from the database, ordered by ID.
+
+    Pass the ID of the last record returned as `after_id` to get the next page.
 
     Args:
         db (Session): Database session.
-        appointment (AppointmentCreate): Data for creating a new appointment.
+        after_id (int): Return only records with a greater ID.
+        limit (Optional[int]): Page size; None returns all remaining records.
 
     Returns:
-        Appointment: The newly created appointment record.
+        List[Appointment]: A page of appointments.
     """
-    db_appointment = Appointment(**appointment.dict())
-    db.add(db_appointment)
-    db.commit()
-    db.refresh(db_appointment)
-    return db_appointment
+    return _page(db, Appointment, Appointment.Appointment_ID, after_id, limit)
 
 
-def get_appointments(db: Session) -> List[Appointment]:
+def get_appointment(db: Session, appointment_id: int) -> Optional[Appointment]:
     """
-    Retrieve all appointments from the database.
+    Retrieve a specific appointment by ID.
 
     Args:
         db (Session): Database session.
+        appointment_id (int): ID of the appointment to retrieve.
 
     Returns:
-        List[Appointment]: A list of all appointments.
+        Optional[Appointment]: The appointment record, if found; otherwise, None.
     """
-    return db.query(Appointment).all()
+    return db.get(Appointment, appointment_id)
 
 
-def get_appointment(db: Session, appointment_id: int) -> Optional[Appointment]:
+def create_appointment(db: Session, appointment: AppointmentCreate) -> Appointment:
     """
-    Retrieve a specific appointment by ID.
+    Create a new appointment in the database.
 
     Args:
         db (Session): Database session.
-        appointment_id (int): ID of the appointment to retrieve.
+        appointment (AppointmentCreate): Data for creating a new appointment.
 
     Returns:
-        Optional[Appointment]: The appointment record, if found; otherwise, None.
+        Appointment: The newly created appointment record.
+    """
+    db_appointment = Appointment(**appointment.model_dump())
+    db.add(db_appointment)
+    _commit(db)
+    db.refresh(db_appointment)
+    return db_appointment
+
+
+def bulk_create_appointments(db: Session, appointments: List[AppointmentCreate]) -> List[Appointment]:
     """
-    return db.query(Appointment).filter(Appointment.Appointment_ID == appointment_id).first()
+    Create many appointments with a single INSERT.
+
+    Args:
+        db (Session): Database session.
+        appointments (List[AppointmentCreate]): Data for the new appointments.
+
+    Returns:
+        List[Appointment]: The newly created records.
+    """
+    return _bulk_insert(db, Appointment, [item.model_dump() for item in appointments])
 
 
 def update_appointment(db: Session, appointment_id: int, appointment: AppointmentCreate) -> Optional[Appointment]:
@@ -516,13 +924,7 @@ def update_appointment(db: Session, appointment_id: int, appointment: Appointmen
     Returns:
         Optional[Appointment]: The updated appointment record, if found; otherwise, None.
     """
-    db_appointment = get_appointment(db, appointment_id)
-    if db_appointment:
-        for key, value in appointment.dict().items():
-            setattr(db_appointment, key, value)
-        db.commit()
-        db.refresh(db_appointment)
-    return db_appointment
+    return _update_by_pk(db, Appointment, Appointment.Appointment_ID, appointment_id, appointment.model_dump(exclude_unset=True))
 
 
 def delete_appointment(db: Session, appointment_id: int) -> Optional[Appointment]:
@@ -536,14 +938,10 @@ def delete_appointment(db: Session, appointment_id: int) -> Optional[Appointment
     Returns:
         Optional[Appointment]: The deleted appointment record, if found; otherwise, None.
     """
-    db_appointment = get_appointment(db, appointment_id)
-    if db_appointment:
-        db.delete(db_appointment)
-        db.commit()
-    return db_appointment
+    return _delete_by_pk(db, Appointment, Appointment.Appointment_ID, appointment_id)
 
 
-def get_appointments_by_doctor_id(db: Session, doctor_id: int):
+def get_appointments_by_doctor_id(db: Session, doctor_id: int) -> Result:
     """
     Query appointment information based on doctor ID, instead of displaying doctor ID and patient ID,
     it displays doctor's name and patient's name.
@@ -553,16 +951,10 @@ def get_appointments_by_doctor_id(db: Session, doctor_id: int):
         doctor_id (int): Doctor ID
 
     Returns:
-        List[dict]: List of dictionaries containing reservation information
+        Result: Rows of reservation information, fetched from the server 500 at a time.
+            Consume it fully before running other queries on the session.
     """
-    return db.query(
-        Appointment.Appointment_ID,
-        Appointment.Appointment_Date,
-        Appointment.Statusof,
-        Appointment.Typeof,
-        Appointment.Speciality,
-        Appointment.Notes,
-    ).filter(Appointment.Doc_ID == doctor_id).all()
+    return db.execute(_GET_APPOINTMENTS_BY_DOCTOR, {"id": doctor_id})
 
 
 def get_appointments_by_speciality(db: Session, speciality: str) -> List[dict]:
@@ -577,15 +969,9 @@ def get_appointments_by_speciality(db: Session, speciality: str) -> List[dict]:
     Returns:
         List[dict]: List of dictionaries containing reservation information
     """
-    return db.query(
-        Appointment.Appointment_ID,
-        Appointment.Appointment_Date,
-        Appointment.Statusof,
-        Appointment.Typeof,
-        Appointment.Speciality,
-        Appointment.Notes).filter(Appointment.Speciality == speciality).all()
+    return db.execute(_GET_APPOINTMENTS_BY_SPECIALITY, {"speciality": speciality}).all()
 
-def get_appointments_by_patient_id(db: Session, patient_id: int) -> List[dict]:
+def get_appointments_by_patient_id(db: Session, patient_id: int) -> Result:
     """
     Query appointment information based on patient ID, instead of displaying doctor ID and patient ID,
     it displays doctor's name and patient's name.
@@ -595,16 +981,10 @@ def get_appointments_by_patient_id(db: Session, patient_id: int) -> List[dict]:
         patient_id (int): Patient ID
 
     Returns:
-        List[dict]: List of dictionaries containing reservation information
+        Result: Rows of reservation information, fetched from the server 500 at a time.
+            Consume it fully before running other queries on the session.
     """
-    return db.query(
-        Appointment.Appointment_ID,
-        Appointment.Appointment_Date,
-        Appointment.Statusof,
-        Appointment.Typeof,
-        Appointment.Speciality,
-        Appointment.Notes
-    ).filter(Appointment.Patient_ID == patient_id).all()
+    return db.execute(_GET_APPOINTMENTS_BY_PATIENT, {"id": patient_id})
 
 
 # Medical History API
@@ -619,24 +999,42 @@ def create_medical_history(db: Session, history: MedicalHistoryCreate) -> Medica
     Returns:
         Appointment: The newly created MedicalHistory record.
     """
-    db_history = MedicalHistory(**history.dict())
+    db_history = MedicalHistory(**history.model_dump())
     db.add(db_history)
-    db.commit()
+    _commit(db)
     db.refresh(db_history)
     return db_history
 
 
-def get_medical_historys(db: Session) -> List[MedicalHistory]:
+def bulk_create_medical_historys(db: Session, historys: List[MedicalHistoryCreate]) -> List[MedicalHistory]:
     """
-    Retrieve all MedicalHistory from the database.
+    Create many medical history records with a single INSERT.
 
     Args:
         db (Session): Database session.
+        historys (List[MedicalHistoryCreate]): Data for the new medical history records.
 
     Returns:
-        List[MedicalHistory]: A list of all MedicalHistory.
+        List[MedicalHistory]: The newly created records.
     """
-    return db.query(MedicalHistory).all()
+    return _bulk_insert(db, MedicalHistory, [item.model_dump() for item in historys])
+
+
+def get_medical_historys(db: Session, after_id: int = 0, limit: Optional[int] = 100) -> List[MedicalHistory]:
+    """
+    Retrieve a page of MedicalHistory from the database, ordered by ID.
+
+    Pass the ID of the last record returned as `after_id` to get the next page.
+
+    Args:
+        db (Session): Database session.
+        after_id (int): Return only records with a greater ID.
+        limit (Optional[int]): Page size; None returns all remaining records.
+
+    Returns:
+        List[MedicalHistory]: A page of MedicalHistory.
+    """
+    return _page(db, MedicalHistory, MedicalHistory.History_ID, after_id, limit)
 
 
 def get_medical_history(db: Session, history_id: int) -> Optional[MedicalHistory]:
@@ -650,7 +1048,7 @@ def get_medical_history(db: Session, history_id: int) -> Optional[MedicalHistory
     Returns:
         Optional[MedicalHistory]: The medical history record, if found; otherwise, None.
     """
-    return db.query(MedicalHistory).filter(MedicalHistory.History_ID == history_id).first()
+    return db.get(MedicalHistory, history_id)
 
 
 def update_medical_history(db: Session, history_id: int, history: MedicalHistoryCreate) -> Optional[MedicalHistory]:
@@ -665,13 +1063,7 @@ def update_medical_history(db: Session, history_id: int, history: MedicalHistory
     Returns:
         Optional[MedicalHistory]: The updated medical history record, if found; otherwise, None.
     """
-    db_history = get_medical_history(db, history_id)
-    if db_history:
-        for key, value in history.dict().items():
-            setattr(db_history, key, value)
-        db.commit()
-        db.refresh(db_history)
-    return db_history
+    return _update_by_pk(db, MedicalHistory, MedicalHistory.History_ID, history_id, history.model_dump(exclude_unset=True))
 
 
 def delete_medical_history(db: Session, history_id: int) -> Optional[MedicalHistory]:
@@ -685,14 +1077,10 @@ def delete_medical_history(db: Session, history_id: int) -> Optional[MedicalHist
     Returns:
         Optional[MedicalHistory]: The deleted Medical History record, if found; otherwise, None.
     """
-    db_history = get_medical_history(db, history_id)
-    if db_history:
-        db.delete(db_history)
-        db.commit()
-    return db_history
+    return _delete_by_pk(db, MedicalHistory, MedicalHistory.History_ID, history_id)
 
 
-def get_medical_history_by_doctor_id(db: Session, doctor_id: int) -> List[dict]:
+def get_medical_history_by_doctor_id(db: Session, doctor_id: int) -> Result:
     """
     Query Medical History information based on doctor ID, instead of displaying doctor ID and patient ID,
     it displays doctor's name and patient's name.
@@ -702,21 +1090,13 @@ def get_medical_history_by_doctor_id(db: Session, doctor_id: int) -> List[dict]:
         doctor_id (int): Doctor ID
 
     Returns:
-        List[dict]: List of dictionaries containing reservation information
+        Result: Rows of medical history information, fetched from the server 500 at a time.
+            Consume it fully before running other queries on the session.
     """
-    return db.query(
-        MedicalHistory.History_ID,
-        MedicalHistory.Diagnosis,
-        MedicalHistory.Treatment,
-        MedicalHistory.Record_Date,
-        Doctor.Doc_Name,
-        Patient.Patient_Name
-    ).join(Doctor, MedicalHistory.Doc_ID == Doctor.Doc_ID)\
-     .join(Patient, MedicalHistory.Patient_ID == Patient.Patient_ID)\
-     .filter(MedicalHistory.Doc_ID == doctor_id).all()
+    return db.execute(_GET_HISTORY_BY_DOCTOR, {"id": doctor_id})
 
 
-def get_medical_history_by_patient_id(db: Session, patient_id: int) -> List[dict]:
+def get_medical_history_by_patient_id(db: Session, patient_id: int) -> Result:
     """
     Query Medical History information based on patient ID, instead of displaying doctor ID and patient ID,
     it displays doctor's name and patient's name.
@@ -726,20 +1106,13 @@ def get_medical_history_by_patient_id(db: Session, patient_id: int) -> List[dict
         patient_id (int): Patient ID
 
     Returns:
-        List[dict]: List of dictionaries containing reservation information
+        Result: Rows of medical history information, fetched from the server 500 at a time.
+            Consume it fully before running other queries on the session.
     """
-    return db.query(
-        MedicalHistory.History_ID,
-        MedicalHistory.Diagnosis,
-        MedicalHistory.Treatment,
-        MedicalHistory.Record_Date,
-        Doctor.Doc_Name,
-        Patient.Patient_Name
-    ).join(Doctor, MedicalHistory.Doc_ID == Doctor.Doc_ID)\
-     .join(Patient, MedicalHistory.Patient_ID == Patient.Patient_ID)\
-     .filter(MedicalHistory.Patient_ID == patient_id).all()
+    return db.execute(_GET_HISTORY_BY_PATIENT, {"id": patient_id})
 
 
+# Bed API
 def get_bed(db: Session, bed_id: int) -> Optional[Bed]:
     """
     Retrieve a specific Bed by ID.
@@ -751,7 +1124,7 @@ def get_bed(db: Session, bed_id: int) -> Optional[Bed]:
     Returns:
         Optional[Bed]: The Bed record, if found; otherwise, None.
     """
-    return db.query(Bed).filter(Bed.Bed_ID == bed_id).first()
+    return db.get(Bed, bed_id)
 
 
 def get_available_bed(db: Session) -> List[Bed]:
@@ -763,7 +1136,7 @@ def get_available_bed(db: Session) -> List[Bed]:
     Returns:
         Optional[Bed]: The Bed record, if found; otherwise, None.
     '''
-    return db.query(Bed).filter(Bed.Status == 'Available').all()
+    return db.scalars(_GET_BEDS_BY_STATUS, {"status": 'Available'}).all()
 
 
 def get_occupied_bed(db: Session) -> List[Bed]:
@@ -775,7 +1148,20 @@ def get_occupied_bed(db: Session) -> List[Bed]:
     Returns:
         Optional[Bed]: The Bed record, if found; otherwise, None.
     '''
-    return db.query(Bed).filter(Bed.Status == 'Occupied').all()
+    return db.scalars(_GET_BEDS_BY_STATUS, {"status": 'Occupied'}).all()
+
+
+def get_bed_counts(db: Session) -> Dict[str, int]:
+    """
+    Count beds per status with one grouped query, e.g. for an occupancy summary.
+
+    Args:
+        db (Session): Database session.
+
+    Returns:
+        Dict[str, int]: Number of beds per status, e.g. {'Available': 12, 'Occupied': 30}.
+    """
+    return dict(db.execute(_COUNT_BEDS_BY_STATUS).all())
 
 
 def update_bed(db: Session, bed_id: int, bed: BedCreate) -> Optional[Bed]:
@@ -790,13 +1176,26 @@ def update_bed(db: Session, bed_id: int, bed: BedCreate) -> Optional[Bed]:
     Returns:
         Optional[BedBase]: The updated bed record, if found; otherwise, None.
     """
-    db_bed = get_bed(db, bed_id)
-    if db_bed:
-        for key, value in bed.dict().items():
-            setattr(db_bed, key, value)
-        db.commit()
-        db.refresh(db_bed)
-    return db_bed
+    return _update_by_pk(db, Bed, Bed.Bed_ID, bed_id, bed.model_dump(exclude_unset=True))
+
+
+def set_bed_status(db: Session, bed_id: int, status: BedStatus, patient_id: Optional[int] = None,
+                   assigned_date: Optional[datetime] = None) -> Optional[Bed]:
+    """
+    Assign or release a bed with one UPDATE of its occupancy columns.
+
+    Args:
+        db (Session): Database session.
+        bed_id (int): ID of the Bed to update.
+        status (BedStatus): New status, 'Occupied' or 'Available'.
+        patient_id (Optional[int]): Patient in the bed; None when released.
+        assigned_date (Optional[datetime]): When the patient was assigned; None when released.
+
+    Returns:
+        Optional[Bed]: The updated bed record, if found; otherwise, None.
+    """
+    return _update_by_pk(db, Bed, Bed.Bed_ID, bed_id,
+                         {"Status": status, "Patient_ID": patient_id, "Assigned_Date": assigned_date})
 
 
 # Prescription API
@@ -810,71 +1209,56 @@ def create_prescription(db: Session, prescription: PrescriptionCreate) -> Prescr
     Returns:
         Prescription: The newly created Prescription record.
     """
-    db_prescription = Prescription(**prescription.dict())
+    db_prescription = Prescription(**prescription.model_dump())
     db.add(db_prescription)
-    db.commit()
+    _commit(db)
     db.refresh(db_prescription)
     return db_prescription
 
 
-def create_prescription_detail(db: Session, prescriptiondetail: PrescriptionDetailCreate) -> PrescriptionDetail:
+def bulk_create_prescriptions(db: Session, prescriptions: List[PrescriptionCreate]) -> List[Prescription]:
     """
-    Create a new Prescription in the database.
+    Create many prescriptions with a single INSERT.
 
     Args:
         db (Session): Database session.
-        prescriptiondetail (PrescriptionDetailCreate): Data for creating a new Prescriptionetail.
+        prescriptions (List[PrescriptionCreate]): Data for the new prescriptions.
+
     Returns:
-        PrescriptionDetail: The newly created Prescription Detail record.
+        List[Prescription]: The newly created records.
     """
-    prescriptiondetail = PrescriptionDetail(**prescriptiondetail.dict())
-    db.add(prescriptiondetail)
-    db.commit()
-    db.refresh(prescriptiondetail)
-    return prescriptiondetail
+    return _bulk_insert(db, Prescription, [item.model_dump() for item in prescriptions])
 
 
-def get_prescriptions_id(db: Session, prescription_id: int) -> Optional[Prescription]:
+def get_prescriptions(db: Session, after_id: int = 0, limit: Optional[int] = 100) -> List[Prescription]:
     """
-    Retrieve a specific Prescription by ID.
+    Retrieve a page of Prescriptions from the database, ordered by ID.
+
+    Pass the ID of the last record returned as `after_id` to get the next page.
 
     Args:
         db (Session): Database session.
-        Prescription_id (int): ID of the Prescription to retrieve.
+        after_id (int): Return only records with a greater ID.
+        limit (Optional[int]): Page size; None returns all remaining records.
 
     Returns:
-        List[Prescription]: The Prescription record, if found; otherwise, None.
+        List[Prescription]: A page of Prescriptions.
     """
-    return db.query(Prescription).filter(Prescription.Prescription_ID == prescription_id).first()
+    return _page(db, Prescription, Prescription.Prescription_ID, after_id, limit)
 
 
-def get_prescriptions_by(db: Session, searchby: str, value: int) -> List[dict]:
+def get_prescriptions_id(db: Session, prescription_id: int) -> Optional[Prescription]:
     """
-    Query Prescription information based on patient ID or Doc ID, instead of displaying doctor ID and patient ID,
-    it displays doctor's name and patient's name.
+    Retrieve a specific Prescription by ID.
 
     Args:
-        db (Session): SQLAlchemy Session
-        column_name (str): String
-        value (int): Doc_ID or Patent_ID
+        db (Session): Database session.
+        Prescription_id (int): ID of the Prescription to retrieve.
+
     Returns:
-        List[dict]: List of dictionaries containing reservation information
+        List[Prescription]: The Prescription record, if found; otherwise, None.
     """
-    return db.query(
-        Prescription.Prescription_ID,
-        Doctor.Doc_Name,
-        Patient.Patient_Name,
-        Prescription.Date_Issued,
-        Prescription.Notes,
-        PrescriptionDetail.Medication_Name,
-        PrescriptionDetail.Dosage,
-        PrescriptionDetail.Frequency,
-        PrescriptionDetail.Duration
-
-    ).join(Doctor, Prescription.Doctor_ID == Doctor.Doc_ID)\
-     .join(Patient, Prescription.Patient_ID == Patient.Patient_ID)\
-     .join(PrescriptionDetail, Prescription.Prescription_ID == PrescriptionDetail.Prescription_ID) \
-     .filter(eval(searchby)).all()
+    return db.get(Prescription, prescription_id)
 
 
 def update_prescription(db: Session, prescription_id: int, prescription: PrescriptionCreate) -> Optional[Prescription]:
@@ -889,13 +1273,38 @@ def update_prescription(db: Session, prescription_id: int, prescription: Prescri
     Returns:
         Optional[Prescription]: The updated Prescription record, if found; otherwise, None.
     """
-    db_prescription = get_prescriptions_id(db, prescription_id)
-    if db_prescription:
-        for key, value in prescription.dict().items():
-            setattr(db_prescription, key, value)
-        db.commit()
-        db.refresh(db_prescription)
-    return db_prescription
+    return _update_by_pk(db, Prescription, Prescription.Prescription_ID, prescription_id, prescription.model_dump(exclude_unset=True))
+
+
+def create_prescription_detail(db: Session, prescriptiondetail: PrescriptionDetailCreate) -> PrescriptionDetail:
+    """
+    Create a new Prescription in the database.
+
+    Args:
+        db (Session): Database session.
+        prescriptiondetail (PrescriptionDetailCreate): Data for creating a new Prescriptionetail.
+    Returns:
+        PrescriptionDetail: The newly created Prescription Detail record.
+    """
+    prescriptiondetail = PrescriptionDetail(**prescriptiondetail.model_dump())
+    db.add(prescriptiondetail)
+    _commit(db)
+    db.refresh(prescriptiondetail)
+    return prescriptiondetail
+
+
+def bulk_create_prescription_details(db: Session, prescriptiondetails: List[PrescriptionDetailCreate]) -> List[PrescriptionDetail]:
+    """
+    Create many prescription details with a single INSERT.
+
+    Args:
+        db (Session): Database session.
+        prescriptiondetails (List[PrescriptionDetailCreate]): Data for the new prescription details.
+
+    Returns:
+        List[PrescriptionDetail]: The newly created records.
+    """
+    return _bulk_insert(db, PrescriptionDetail, [item.model_dump() for item in prescriptiondetails])
 
 
 def get_prescriptions_detail_id(db: Session, prescriptiondetail_id: int) -> Optional[PrescriptionDetail]:
@@ -907,30 +1316,60 @@ def get_prescriptions_detail_id(db: Session, prescriptiondetail_id: int) -> Opti
         prescriptiondetail_id (int): ID of the Prescription Detail to retrieve.
 
     Returns:
-        List[PrescriptionDetail]: The PrescriptionDetail record, if found; otherwise, None.
+        Optional[PrescriptionDetail]: The PrescriptionDetail record, if found; otherwise, None.
     """
-    return db.query(PrescriptionDetail).filter(PrescriptionDetail.Prescription_ID == prescriptiondetail_id).first()
+    return db.get(PrescriptionDetail, prescriptiondetail_id)
 
 
-def update_prescription_detail(db: Session, prescription_id: int, prescriptiondetail: PrescriptionDetailCreate) -> Optional[PrescriptionDetail]:
+def update_prescription_detail(db: Session, prescriptiondetail_id: int, prescriptiondetail: PrescriptionDetailCreate) -> Optional[PrescriptionDetail]:
     """
     Update an existing Prescription's details.
 
     Args:
         db (Session): Database session.
-        prescription_id (int): ID of the prescription to update.
+        prescriptiondetail_id (int): ID (Detail_ID) of the prescription detail to update.
         prescriptiondetail (PrscriptionDetailBase): Updated prscripiton data.
 
     Returns:
-        Optional[PrescriptionDetail]: The updated Prescription record, if found; otherwise, None.
+        Optional[PrescriptionDetail]: The updated Prescription Detail record, if found; otherwise, None.
     """
-    db_prescription_detail = get_prescriptions_detail_id(db, prescription_id)
-    if db_prescription_detail:
-        for key, value in prescriptiondetail.dict().items():
-            setattr(db_prescription_detail, key, value)
-        db.commit()
-        db.refresh(db_prescription_detail)
-    return db_prescription_detail
+    return _update_by_pk(db, PrescriptionDetail, PrescriptionDetail.Detail_ID, prescriptiondetail_id,
+                         prescriptiondetail.model_dump(exclude_unset=True))
+
+
+def get_prescription_with_details(db: Session, prescription_id: int) -> Optional[Prescription]:
+    """
+    Retrieve a Prescription together with its detail lines.
+
+    The details are loaded up front by a single IN query, so reading
+    `details` afterwards issues no further queries.
+
+    Args:
+        db (Session): Database session.
+        prescription_id (int): ID of the Prescription to retrieve.
+
+    Returns:
+        Optional[Prescription]: The Prescription record, if found; otherwise, None.
+    """
+    return db.execute(_GET_PRESCRIPTION_WITH_DETAILS, {"id": prescription_id}).scalar_one_or_none()
+
+
+def get_prescriptions_by(db: Session, by: Literal["prescription", "doctor", "patient"], value: int) -> List[dict]:
+    """
+    Query Prescription information based on prescription ID, doctor ID or patient ID, instead of displaying
+    doctor ID and patient ID, it displays doctor's name and patient's name.
+
+    Args:
+        db (Session): SQLAlchemy Session
+        by (str): Which ID `value` is: 'prescription', 'doctor' or 'patient'
+        value (int): Prescription_ID, Doc_ID or Patient_ID
+    Returns:
+        List[dict]: List of dictionaries containing reservation information
+
+    Raises:
+        KeyError: If `by` is not one of the supported lookups.
+    """
+    return db.execute(_GET_PRESCRIPTIONS_BY[by], {"value": value}).all()
 
 
 def create_notification(db: Session, notification: NotificationCreate) -> Notification:
@@ -948,49 +1387,105 @@ def create_notification(db: Session, notification: NotificationCreate) -> Notifi
         Recipient_Type=notification.Recipient_Type,
         Recipient_ID=notification.Recipient_ID,
         Message=notification.Message,
-        Status='Unread',
-        Created_At=datetime.now()
+        Status='Unread'
     )
     db.add(db_notification)
-    db.commit()
-    db.refresh(db_notification)
+    _commit(db)
     return db_notification
 
 
+def create_notification_once(db: Session, notification: NotificationCreate) -> Optional[Notification]:
+    """
+    Create a notification unless the same unread message is already waiting for the recipient.
+
+    Safe to call again when a sender retries.
+
+    Args:
+        db (Session): Database session.
+        notification (NotificationCreate): Data for the new notification.
+
+    Returns:
+        Optional[Notification]: The created notification, or None if it already existed.
+    """
+    values = {
+        "Recipient_Type": notification.Recipient_Type,
+        "Recipient_ID": notification.Recipient_ID,
+        "Message": notification.Message,
+        "Status": 'Unread',
+    }
+    return _insert_if_absent(db, Notification, values, ["Recipient_Type", "Recipient_ID", "Message", "Status"])
+
+
+def bulk_create_notifications(db: Session, notifications: List[NotificationCreate]) -> List[Notification]:
+    """
+    Create many unread notifications with a single INSERT.
+
+    Args:
+        db (Session): Database session.
+        notifications (List[NotificationCreate]): Data for the new notifications.
+
+    Returns:
+        List[Notification]: The created notification records.
+    """
+    return _bulk_insert(db, Notification, [
+        {
+            "Recipient_Type": notification.Recipient_Type,
+            "Recipient_ID": notification.Recipient_ID,
+            "Message": notification.Message,
+            "Status": 'Unread',
+        }
+        for notification in notifications
+    ])
+
+
 def mark_notification_as_read(db: Session, notification_id: int) -> Optional[Notification]:
     """
-    Mark a notification as read.
+    Mark an unread notification as read, stamping Read_At with the database time.
 
     Args:
         db (Session): Database session.
         notification_id (int): ID of the notification to mark as read.
 
-
     Returns:
-        Notification: The updated notification record.
+        Optional[Notification]: The updated notification record, or None if it does not exist
+            or was already read.
     """
-    db_notification = db.query(Notification).filter(Notification.Notification_ID == notification_id).first()
-    if db_notification:
-        db_notification.Status = 'Read'
-        db_notification.Read_At = datetime.now()
-        db.commit()
-        db.refresh(db_notification)
+    db_notification = db.scalars(_MARK_NOTIFICATION_AS_READ, {"id": notification_id}).one_or_none()
+    _commit(db)
     return db_notification
 
 
-def get_notifications_for_recipient(db: Session, recipient_type: str, recipient_id: int) -> List[Notification]:
+def mark_notifications_as_read(db: Session, notification_ids: List[int]) -> int:
+    """
+    Mark several unread notifications as read with a single UPDATE.
+
+    Args:
+        db (Session): Database session.
+        notification_ids (List[int]): IDs of the notifications to mark as read.
+
+    Returns:
+        int: Number of notifications that changed from unread to read.
+    """
+    if not notification_ids:
+        return 0
+    result = db.execute(_MARK_NOTIFICATIONS_AS_READ, {"ids": list(notification_ids)})
+    _commit(db)
+    return result.rowcount
+
+
+def get_notifications_for_recipient(db: Session, recipient_type: RecipientType, recipient_id: int) -> List[Notification]:
     """
     Retrieve all notifications for a specific recipient.
 
     Args:
         db (Session): Database session.
-        recipient_type (str): Type of the recipient ('Doctor', 'Patient', 'Staff').
+        recipient_type (RecipientType): Type of the recipient ('Doctor', 'Patient', 'Staff').
         recipient_id (int): ID of the recipient.
 
     Returns:
         List[Notification]: List of notifications for the recipient.
     """
-    return db.query(Notification).filter(
-        Notification.Recipient_Type == recipient_type,
-        Notification.Recipient_ID == recipient_id
+    return db.scalars(
+        _GET_NOTIFICATIONS_FOR_RECIPIENT,
+        {"recipient_type": recipient_type, "recipient_id": recipient_id}
     ).all()
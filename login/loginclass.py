@@ -1,54 +1,230 @@
 import sqlite3
+import contextlib
+import functools
 import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Kept as constants so every call hits sqlite3's prepared statement cache
+_SQL_INSERT = "INSERT INTO users (username, password, salt, role) VALUES (?, ?, ?, ?)"
+# SQLite's planner prefers the UNIQUE autoindex, so name the covering index explicitly
+_SQL_SELECT = "SELECT password, salt, role FROM users INDEXED BY ix_users_lookup WHERE username = ?"
+_SQL_SELECT_USERNAMES = "SELECT username FROM users INDEXED BY ix_users_role"
+_SQL_SELECT_ALL = "SELECT username, password, salt FROM users INDEXED BY ix_users_lookup"
+# Only replaces the hash that was verified, so a concurrent change (or a stale cache entry) can't be overwritten
+_SQL_UPDATE = "UPDATE users SET password = ?, salt = ? WHERE username = ? AND password = ?"
+# Covers _SQL_SELECT so logins are answered from the index alone; created in _upgrade_schema
+_SQL_CREATE_LOOKUP_INDEX = "CREATE INDEX IF NOT EXISTS ix_users_lookup ON users (username, password, salt, role)"
+# Role scans walk only this narrow index instead of every user row
+_SQL_SELECT_BY_ROLE = "SELECT username FROM users INDEXED BY ix_users_role WHERE role = ? ORDER BY username"
+_SQL_CREATE_ROLE_INDEX = "CREATE INDEX IF NOT EXISTS ix_users_role ON users (role, username)"
+
+# scrypt cost parameters (about 16 MiB of memory per hash), bound once
+_scrypt = functools.partial(hashlib.scrypt, n=2 ** 14, r=8, p=1, dklen=32)
+_SALT_SIZE = 16
+
+# Compared against when masking unknown usernames; never matches a real hash
+_DUMMY_SALT = bytes(_SALT_SIZE)
+_DUMMY_HASH = bytes(32)
+
+_VALID_ROLES = frozenset({"admin", "doctor", "staff"})
+
+_ERR_ROLE = "Error: Role '%s' is invalid. Valid roles are: admin, doctor, staff"
+_ERR_TAKEN = "Error: Username '%s' is already taken."
+_ERR_BATCH_TAKEN = "Error: One or more usernames are already taken; no users were registered."
+_ERR_LOGIN = ("Error: Invalid username or password.", None)
+_ERR_OLD_PASSWORD = "Error: Old password is incorrect."
 
 class LoginSystem:
-    def __init__(self, db_path="login.db"):
+    def __init__(self, db_path="login.db", mask_unknown_users=True):
         self.db_path = db_path
+        # Unknown usernames spend a dummy hash so misses can't be told apart by timing;
+        # turning this off skips that hash but lets callers probe which usernames exist
+        self.mask_unknown_users = mask_unknown_users
+        # One long-lived connection keeps SQLite's page cache warm between calls
+        # Autocommit mode; write paths open their own transaction in _write_transaction
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=128,
+                                     isolation_level=None)
+        self._conn.executescript(
+            "PRAGMA busy_timeout=5000;"
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-64000;"
+            "PRAGMA mmap_size=268435456;"
+        )
+        self._write_lock = threading.Lock()
+        # username -> (hash, salt, role), filled lazily so repeat logins skip SQLite
+        self._cache = {}
+        # Every existing username, so lookups for unknown names never reach SQLite
+        self._usernames = None
+        # Both caches are dropped when another connection commits (PRAGMA data_version changes)
+        self._data_version = None
+        self._upgrade_schema()
+
+    def _upgrade_schema(self):
+        """Brings databases created by older versions of logindb.py up to date."""
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(users)")]
+        if not columns:
+            return
+        with self._write_transaction():
+            if "salt" not in columns:
+                self._conn.execute("ALTER TABLE users ADD COLUMN salt BLOB")
+            self._conn.execute(_SQL_CREATE_LOOKUP_INDEX)
+            self._conn.execute(_SQL_CREATE_ROLE_INDEX)
+
+    @contextlib.contextmanager
+    def _write_transaction(self):
+        """Runs the enclosed writes in one BEGIN IMMEDIATE transaction."""
+        with self._write_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self):
+        """Closes the underlying database connection."""
+        self._conn.close()
+
+    def _hash_password(self, password, salt):
+        """Hashes UTF-8 password bytes with scrypt and the given salt, returning the raw digest."""
+        return _scrypt(password, salt=salt)
+
+    def _verify_password(self, password, stored_hash, salt):
+        """Checks password bytes against a stored hash; unsalted hashes are legacy SHA256."""
+        if salt is None:
+            candidate = hashlib.sha256(password).digest()
+        else:
+            candidate = self._hash_password(password, salt)
+        if isinstance(stored_hash, str):
+            # Hex digests written before hashes were stored as BLOBs
+            stored_hash = bytes.fromhex(stored_hash)
+        return hmac.compare_digest(candidate, stored_hash)
+
+    def _sync_caches(self):
+        """Drops the cached users if another connection changed the database since the last check."""
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._cache.clear()
+            self._usernames = None
+            self._data_version = data_version
 
-    def _hash_password(self, password):
-        """Hashes a password using SHA256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def _username_exists(self, username):
+        """Checks the in-memory username set, loading it if it was dropped."""
+        if self._usernames is None:
+            self._usernames = {username for (username,) in self._conn.execute(_SQL_SELECT_USERNAMES)}
+        return username in self._usernames
+
+    def _lookup(self, username):
+        """Returns the (hash, salt, role) of a user, or None if the user does not exist."""
+        self._sync_caches()
+        user = self._cache.get(username)
+        if user is None:
+            if not self._username_exists(username):
+                return None
+            user = self._conn.execute(_SQL_SELECT, (username,)).fetchone()
+            if user is not None:
+                self._cache[username] = user
+        return user
+
+    def _remember_usernames(self, usernames):
+        """Adds usernames written through this connection, which does not bump its own data_version."""
+        if self._usernames is not None:
+            self._usernames.update(usernames)
+
+    def _store_password(self, username, password, current_hash):
+        """Replaces a verified hash with a freshly salted hash of the password (as UTF-8 bytes).
+
+        Returns False if the stored hash no longer matches `current_hash`."""
+        salt = os.urandom(_SALT_SIZE)
+        new_hash = self._hash_password(password, salt)
+        with self._write_transaction():
+            updated = self._conn.execute(_SQL_UPDATE, (new_hash, salt, username, current_hash)).rowcount
+        self._cache.pop(username, None)
+        return updated == 1
 
     def register_user(self, username, password, role):
         """Registers a new user."""
-        hashed_password = self._hash_password(password)
-        roles = ["admin", "doctor", "staff"]
-        if role not in roles:
-            return f"Error: Role '{role}' is invalid. Valid roles are: {', '.join(roles)}"
+        if role not in _VALID_ROLES:
+            return _ERR_ROLE % role
         else:
+            salt = os.urandom(_SALT_SIZE)
+            hashed_password = self._hash_password(password.encode('utf-8'), salt)
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("INSERT INTO users (username, password, role) VALUES (?, ?, ?)", 
-                                (username, hashed_password, role))
-                    conn.commit()
+                with self._write_transaction():
+                    self._conn.execute(_SQL_INSERT, (username, hashed_password, salt, role))
+                    self._remember_usernames([username])
                     return f"User '{username}' successfully registered!"
             except sqlite3.IntegrityError:
-                return f"Error: Username '{username}' is already taken."
+                return _ERR_TAKEN % username
+
+    def register_users(self, users, max_workers=None):
+        """Registers many (username, password, role) triples in one transaction; nothing is registered on any error."""
+        users = list(users)
+        for _, _, role in users:
+            if role not in _VALID_ROLES:
+                return _ERR_ROLE % role
+        valid = [(username, password, role, os.urandom(_SALT_SIZE)) for username, password, role in users]
+
+        def hash_row(row):
+            username, password, role, salt = row
+            return username, self._hash_password(password.encode('utf-8'), salt), salt, role
+
+        # hashlib releases the GIL while hashing, so threads hash the batch in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(hash_row, valid))
+        try:
+            with self._write_transaction():
+                self._conn.executemany(_SQL_INSERT, rows)
+                self._remember_usernames(row[0] for row in rows)
+                return f"{len(rows)} users successfully registered!"
+        except sqlite3.IntegrityError:
+            return _ERR_BATCH_TAKEN
 
     def login_user(self, username, password):
         """Logs in a user if the credentials are correct."""
-        hashed_password = self._hash_password(password)
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM users WHERE username = ? AND password = ?", 
-                           (username, hashed_password))
-            user = cursor.fetchone()
-            if user:
-                role = user[-1]
-                return f"Welcome, {username}!", role
-            else:
-                return "Error: Invalid username or password.", None
+        password = password.encode('utf-8')
+        hashed, salt, role = self._lookup(username) or (None, None, None)
+        if hashed is None:
+            if self.mask_unknown_users:
+                self._verify_password(password, _DUMMY_HASH, _DUMMY_SALT)
+            return _ERR_LOGIN
+        if self._verify_password(password, hashed, salt):
+            if salt is None:
+                # Upgrade legacy SHA256 hashes now that the plaintext is known
+                self._store_password(username, password, hashed)
+            return f"Welcome, {username}!", role
+        else:
+            return _ERR_LOGIN
+
+    def verify_users(self, credentials, max_workers=None):
+        """Returns the usernames whose password matches, for admin audits over many (username, password) pairs."""
+        stored = {username: (hashed, salt) for username, hashed, salt in self._conn.execute(_SQL_SELECT_ALL)}
+        candidates = [(username, password) for username, password in credentials if username in stored]
+
+        def check(candidate):
+            username, password = candidate
+            return self._verify_password(password.encode('utf-8'), *stored[username])
+
+        # hashlib releases the GIL while hashing, so threads verify in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            matches = pool.map(check, candidates)
+        return [username for (username, _), matched in zip(candidates, matches) if matched]
+
+    def get_usernames_by_role(self, role):
+        """Returns the usernames holding a role, in alphabetical order."""
+        return [username for (username,) in self._conn.execute(_SQL_SELECT_BY_ROLE, (role,))]
 
     def change_password(self, username, old_password, new_password):
         """Changes the user's password after validating the old password."""
-        if self.login_user(username, old_password) == f"Welcome, {username}!":
-            hashed_new_password = self._hash_password(new_password)
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE users SET password = ? WHERE username = ?", 
-                               (hashed_new_password, username))
-                conn.commit()
-                return f"Password for user '{username}' successfully updated!"
+        hashed, salt, _ = self._lookup(username) or (None, None, None)
+        if (hashed is not None and self._verify_password(old_password.encode('utf-8'), hashed, salt)
+                and self._store_password(username, new_password.encode('utf-8'), hashed)):
+            return f"Password for user '{username}' successfully updated!"
         else:
-            return "Error: Old password is incorrect."
+            return _ERR_OLD_PASSWORD
@@ -4,15 +4,34 @@ import sqlite3
 conn = sqlite3.connect("login.db")
 cursor = conn.cursor()
 
+# page_size only applies to a new database (or after VACUUM); journal_mode=WAL persists in the file.
+# mmap_size is per connection, so LoginSystem sets it again when it connects.
+cursor.executescript('''
+PRAGMA page_size = 8192;
+PRAGMA journal_mode = WAL;
+PRAGMA mmap_size = 268435456;
+''')
+
 # Create a table for storing user credentials
 cursor.execute('''
 CREATE TABLE IF NOT EXISTS users (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     username TEXT UNIQUE NOT NULL,
-    password TEXT NOT NULL,
+    password BLOB NOT NULL,
+    salt BLOB,
     role TEXT NOT NULL
 )
 ''')
 
+# Covering index so a login is answered without touching the table rows
+cursor.execute('''
+CREATE INDEX IF NOT EXISTS ix_users_lookup ON users (username, password, salt, role)
+''')
+
+# Narrow index for listing the users of one role
+cursor.execute('''
+CREATE INDEX IF NOT EXISTS ix_users_role ON users (role, username)
+''')
+
 conn.commit()
 conn.close()
@@ -33,64 +33,198 @@ Run the script, and interact with the menu to perform the required operations.
 
 """
 
-import pwinput
-import json
+import functools
+import operator
+import os
 import time
 from sqlalchemy.orm import Session
 from sqlalchemy import text 
-from prettytable import PrettyTable
+from sqlalchemy.engine import Result, RowMapping
 from consolemenu import ConsoleMenu
 from consolemenu.items import FunctionItem, SubmenuItem, ExitItem
+import orjson
 
 from datetime import datetime
 from database import get_db_cli
-from schemas import DoctorBase, StaffBase, StaffShiftBase, PatientBase, TestRecordBase, AppointmentBase, MedicalHistoryBase, BedBase, PrescriptionBase, PrescriptionDetailBase
+from schemas import DoctorBase, StaffBase, StaffShiftBase, PatientBase, TestRecordBase, AppointmentBase, MedicalHistoryBase, PrescriptionBase, PrescriptionDetailBase
 
 from database import Base
+from models import StaffShift
 
 from login.loginclass import LoginSystem
 import db_operator as db_ops
 
 
+# file path -> (st_mtime_ns, parsed help data), filled by load_help_data
+_help_cache = {}
+
+# The one input format parse_date accepts; strptime keeps it strict where fromisoformat would take other ISO forms
+_DT_FMT = '%Y-%m-%d %H:%M:%S'
+
+# Listings longer than this are printed without box borders, which render much faster
+COMPACT_TABLE_ROWS = 200
+
+
+@functools.lru_cache(maxsize=None)
+def _table_columns(model):
+    """
+    Column names of a mapped class and an attrgetter reading them, computed once per class.
+
+    Args:
+        model: SQLAlchemy mapped class.
+    """
+    columns = [column.name for column in model.__table__.columns]
+    return columns, operator.attrgetter(*columns)
+
+
+def _table_rows(rows):
+    """
+    Field names and row values of a non-empty list of SQLAlchemy objects or result rows.
+
+    Args:
+        rows: List of SQLAlchemy objects, Row tuples or RowMappings.
+    """
+    if isinstance(rows[0], Base):
+        columns, getter = _table_columns(type(rows[0]))
+        return columns, [list(getter(row)) for row in rows]
+    if isinstance(rows[0], RowMapping):
+        return list(rows[0].keys()), [list(row.values()) for row in rows]
+    return list(rows[0]._mapping.keys()), [list(row) for row in rows]
+
+
 def print_table(results, stop=True):
     """
     Display query results in a tabular format using PrettyTable.
 
     Args:
-        results: List of SQLAlchemy objects or a single object.
+        results: List of SQLAlchemy objects, a single object, or a streamed Result.
     """
+    # Imported on first use so the login menu comes up without loading it
+    from prettytable import PrettyTable, TableStyle
+
     table = PrettyTable()
 
+    if isinstance(results, Result):
+        results = results.all()
+
     if results:
-        if isinstance(results, list):
-            if isinstance(results[0], Base):
-                table.field_names = [column.name for column in results[0].__table__.columns]
-                for row in results:
-                    table.add_row([getattr(row, column) for column in table.field_names])
-            else:
-                table.field_names = dict(results[0]._mapping).keys()
-                for item in results:
-                    table.add_row(dict(item._mapping).values())
-        else:
-            if isinstance(results, Base):
-                table.field_names = [column.name for column in results.__table__.columns]
-                table.add_row([getattr(results, column) for column in table.field_names])
-            else:
-                results_dict = dict(results._mapping)
-                table.field_names = results_dict.keys()
-                table.add_row(results_dict.values())
+        if not isinstance(results, list):
+            results = [results]
+        elif len(results) > COMPACT_TABLE_ROWS:
+            table.set_style(TableStyle.MARKDOWN)
+        table.field_names, rows = _table_rows(results)
+        table.add_rows(rows)
 
         print(table)
 
     if stop:
         input("Press Enter to return to the menu...")
 
-def is_valid_date(date_str):
+
+def print_table_paged(results, page=50):
+    """
+    Display query results a page at a time, reusing one PrettyTable.
+
+    Streamed results are read one page at a time, so only the page on
+    screen is held in memory.
+
+    Args:
+        results: List of SQLAlchemy objects or a streamed Result.
+        page: Number of rows per page.
+    """
+    from prettytable import PrettyTable
+
+    if isinstance(results, Result):
+        pages = results.partitions(page)
+    else:
+        pages = (results[start:start + page] for start in range(0, len(results), page))
+
+    table = PrettyTable()
+    for rows in pages:
+        field_names, rows = _table_rows(rows)
+        if not table.field_names:
+            table.field_names = field_names
+        table.clear_rows()
+        table.add_rows(rows)
+        print(table)
+        if len(rows) == page and input("[Enter]=next / q=quit: ").strip().lower() == 'q':
+            return
+
+    input("Press Enter to return to the menu...")
+
+
+def prompt_id(prompt):
+    """
+    Ask for a numeric ID until one is entered, before any query is made with it.
+
+    Returns:
+        int: The entered ID.
+    """
+    while True:
+        value = input(prompt).strip()
+        if value.isdigit():
+            return int(value)
+        print('Please enter a numeric ID.')
+
+
+def delete_record(db_session, prompt, get_func, delete_func):
+    """
+    Show the single record to delete and remove it after confirmation.
+
+    Args:
+        db_session: Database session.
+        prompt: Prompt asking for the record ID.
+        get_func: db_ops function loading one record by ID.
+        delete_func: db_ops function deleting one record by ID.
+    """
+    record_id = prompt_id(prompt)
+    record = get_func(db_session, record_id)
+    if record is None:
+        print('No record found with that ID.')
+    else:
+        print_table(record, False)
+        if input('Delete this record? [y/N]: ').strip().lower() == 'y':
+            delete_func(db_session, record_id)
+            print('Deleted.')
+    input("Press Enter to return to the menu...")
+
+
+def parse_date(date_str):
+    """
+    Parse a 'YYYY-MM-DD HH:MM:SS' string.
+
+    Returns:
+        The parsed datetime, or None if the string is not in that format.
+    """
     try:
-        datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-        return True
+        return datetime.strptime(date_str, _DT_FMT)
     except ValueError:
-        return False
+        return None
+
+
+def prompt_default(prompt, current):
+    """
+    Prompt for a field, keeping its current value when the input is left empty.
+
+    Args:
+        prompt (str): Text shown to the user.
+        current: The record's existing value for the field.
+
+    Returns:
+        The entered string, or `current` if nothing was entered.
+    """
+    value = input(prompt)
+    return current if value == '' else value
+
+
+def now():
+    """
+    Current local time truncated to whole seconds, the precision records were stored with.
+
+    Returns:
+        A datetime that can be handed straight to the schemas, skipping a strftime/parse roundtrip.
+    """
+    return datetime.now().replace(microsecond=0)
     
 # Define actions for Doctor management
 def create_doctor(db_session):
@@ -104,7 +238,7 @@ def create_doctor(db_session):
 
     external_data = {'Doc_Name': name, 'Speciality': speciality, 'Phone_Num': phone, 'Email': email}
 
-    result = db_ops.create_doctor(db_session, DoctorBase(**external_data))
+    result = db_ops.create_doctor(db_session, DoctorBase.model_validate(external_data))
     print_table(result)
 
 
@@ -131,20 +265,16 @@ def update_doctor(db_session):
     doctor = db_ops.get_doctor(db_session, doctor_id)
     print_table(doctor, False)
 
-    name = input('Please Enter Name: ')
-    name = doctor.Doc_Name if name == '' else name
+    name = prompt_default('Please Enter Name: ', doctor.Doc_Name)
 
-    phone = input('Please Enter Phone Number: ')
-    phone = doctor.Phone_Num if phone == '' else phone
+    phone = prompt_default('Please Enter Phone Number: ', doctor.Phone_Num)
 
-    speciality = input('Please Enter doctor\'s Speciality: ')
-    speciality = doctor.Speciality if speciality == '' else speciality
+    speciality = prompt_default('Please Enter doctor\'s Speciality: ', doctor.Speciality)
 
-    email = input('Please Enter Email: ')
-    email = doctor.Email if email == '' else email
+    email = prompt_default('Please Enter Email: ', doctor.Email)
 
     external_data = {'Doc_Name': name, 'Speciality': speciality, 'Phone_Num': phone, 'Email': email}
-    db_doctor = db_ops.update_doctor(db_session, doctor_id, DoctorBase(**external_data))
+    db_doctor = db_ops.update_doctor(db_session, doctor_id, DoctorBase.model_validate(external_data))
     print_table(db_doctor)
 
 
@@ -152,10 +282,7 @@ def delete_doctor(db_session):
     """
     Delete a doctor's record by ID.
     """
-    print_table(db_ops.get_doctors(db_session), False)
-    doctor_id = int(input('Please Enter doctor id:'))
-    db_doctor = db_ops.delete_doctor(db_session, doctor_id)
-    print_table(db_doctor)
+    delete_record(db_session, 'Please Enter doctor id:', db_ops.get_doctor, db_ops.delete_doctor)
 
 
 # Define actions for Staff management
@@ -169,7 +296,7 @@ def create_staff(db_session):
 
     external_data = {'Name': name, 'Department': department, 'Upcoming_Shifts': shift}
 
-    result = db_ops.create_staff(db_session, StaffBase(**external_data))
+    result = db_ops.create_staff(db_session, StaffBase.model_validate(external_data))
     print_table(result)
 
 
@@ -196,17 +323,16 @@ def update_staff(db_session):
     staff = db_ops.get_staff_member(db_session, staff_id)
     print_table(staff, False)
 
-    name = input('Please Enter Name: ')
-    name = staff.Doc_Name if name == '' else name
+    name = prompt_default('Please Enter Name: ', staff.Name)
 
-    dept = input('Please Enter Department: ')
-    dept = staff.Department if dept == '' else dept
+    dept = prompt_default('Please Enter Department: ', staff.Department)
 
-    shift = input('Please Enter shift: ')
-    shift = staff.shift if shift == '' else shift
+    email = prompt_default('Please Enter Email: ', staff.Email)
 
-    external_data = {'Name': name, 'Department': dept, 'Upcoming_Shifts': shift}
-    db_staff = db_ops.update_staff(db_session, staff_id, StaffBase(**external_data))
+    hire_date = prompt_default('Please Enter Hire Date: ', staff.Hire_Date)
+
+    external_data = {'Name': name, 'Department': dept, 'Email': email, 'Hire_Date': hire_date}
+    db_staff = db_ops.update_staff(db_session, staff_id, StaffBase.model_validate(external_data))
     print_table(db_staff)
 
 
@@ -214,10 +340,7 @@ def delete_staff(db_session):
     """
     Delete a Staff's record by ID.
     """
-    print_table(db_ops.get_doctors(db_session), False)
-    staff_id = int(input('Please Enter doctor id:'))
-    db_staff = db_ops.delete_staff(db_session, staff_id)
-    print_table(db_staff)
+    delete_record(db_session, 'Please Enter staff id:', db_ops.get_staff_member, db_ops.delete_staff)
 
 
 # Define actions for Staff Shift management
@@ -230,36 +353,38 @@ def create_staff_shift(db_session):
     print_table(staff, False)
 
     while True:
-        staff_id = input('Enter the Staff ID: ')
-        if db_ops.get_staff_member(db_session, staff_id) is None:
+        staff_id = prompt_id('Enter the Staff ID: ')
+        if not db_ops.staff_member_exists(db_session, staff_id):
             print('Invaild Staff ID')
         else:
             break
 
     while True:
-        shift_start = input('Enter the Shift Start Date (YYYY-MM-DD HH:MM:SS): ')
-        if is_valid_date(shift_start):
+        shift_start = parse_date(input('Enter the Shift Start Date (YYYY-MM-DD HH:MM:SS): '))
+        if shift_start is not None:
             break
         else:
             print('Invalid date format. Please enter the date in the format YYYY-MM-DD HH:MM:SS.')
     
     while True:
-        shift_end = input('Enter the Shift End Date (YYYY-MM-DD HH:MM:SS): ')
-        if is_valid_date(shift_end):
+        shift_end = parse_date(input('Enter the Shift End Date (YYYY-MM-DD HH:MM:SS): '))
+        if shift_end is not None:
             break
         else:
             print('Invalid date format. Please enter the date in the format YYYY-MM-DD HH:MM:SS.')
 
     external_data = {'Staff_ID': staff_id, 'Shift_Start': shift_start, 'Shift_End': shift_end}
 
-    result = db_ops.create_staff_shift(db_session, StaffShiftBase(**external_data))
+    # Every field was checked by the loops above, so skip pydantic's second validation pass
+    result = db_ops.create_staff_shift(db_session, StaffShiftBase.model_construct(**external_data))
     print_table(result)
 
 def get_staff_shifts(db_session):
     """
     Display all Staff Shifts from the database.
     """
-    print_table(db_ops.get_staff_shifts(db_session))
+    # Printed as plain table rows; no StaffShift objects are built
+    print_table(StaffShift.dicts(db_session))
 
 def get_staff_shift(db_session):
     """
@@ -273,7 +398,7 @@ def get_staff_shift_by_staff_id(db_session):
     Retrieve and display a specific Staff Shift by Staff ID.
     """
     staff_id = int(input('Please Enter Staff ID:'))
-    print_table(db_ops.get_staff_shift_by_staff_id(db_session, staff_id))
+    print_table(StaffShift.dicts(db_session, Staff_ID=staff_id))
 
 def update_staff_shift(db_session):
     """
@@ -283,27 +408,21 @@ def update_staff_shift(db_session):
     shift = db_ops.get_staff_shift(db_session, shift_id)
     print_table(shift, False)
 
-    staff_id = input('Please Enter Staff ID: ')
-    staff_id = shift.Staff_ID if staff_id == '' else staff_id
+    staff_id = prompt_default('Please Enter Staff ID: ', shift.Staff_ID)
 
-    shift_start = input('Please Enter Shift Start Date: ')
-    shift_start = shift.Shift_Start if shift_start == '' else shift_start
+    shift_start = prompt_default('Please Enter Shift Start Date: ', shift.Shift_Start)
 
-    shift_end = input('Please Enter Shift End Date: ')
-    shift_end = shift.Shift_End if shift_end == '' else shift_end
+    shift_end = prompt_default('Please Enter Shift End Date: ', shift.Shift_End)
 
     external_data = {'Staff_ID': staff_id, 'Shift_Start': shift_start, 'Shift_End': shift_end}
-    db_shift = db_ops.update_staff_shift(db_session, shift_id, StaffShiftBase(**external_data))
+    db_shift = db_ops.update_staff_shift(db_session, shift_id, StaffShiftBase.model_validate(external_data))
     print_table(db_shift)
 
 def delete_staff_shift(db_session):
     """
     Delete a Staff Shift record by ID.
     """
-    print_table(db_ops.get_staff_shifts(db_session), False)
-    shift_id = int(input('Please Enter shift id:'))
-    db_shift = db_ops.delete_staff_shift(db_session, shift_id)
-    print_table(db_shift)
+    delete_record(db_session, 'Please Enter shift id:', db_ops.get_staff_shift, db_ops.delete_staff_shift)
 
 
 # Define actions for Patient management
@@ -321,7 +440,7 @@ def create_patient(db_session):
     external_data = {'Patient_Name': name, 'Patient_Records': record,
          'Phone_Num': phone, 'Email':email, 'Doc_ID':doc_id, 'Staff_ID':staff_id}
 
-    result = db_ops.create_patient(db_session, PatientBase(**external_data))
+    result = db_ops.create_patient(db_session, PatientBase.model_validate(external_data))
     print_table(result)
 
 
@@ -329,7 +448,7 @@ def get_patients(db_session):
     """
     Display all Patients from the database.
     """
-    print_table(db_ops.get_patients(db_session))
+    print_table_paged(db_ops.get_patients(db_session, limit=None))
     print("Listing all patients...")
 
 
@@ -338,7 +457,7 @@ def get_patient(db_session):
     Retrieve and display a specific patient by ID.
     """
     patient_id = int(input('Please Enter patient id:'))
-    print_table(db_ops.get_doctor(db_session, patient_id))
+    print_table(db_ops.get_patient(db_session, patient_id))
 
 
 def update_patient(db_session):
@@ -349,39 +468,30 @@ def update_patient(db_session):
     patient = db_ops.get_patient(db_session, patient_id)
     print_table(patient, False)
 
-    name = input('Please Enter Name: ')
-    name = patient.Patient_Name if name == '' else name
+    name = prompt_default('Please Enter Name: ', patient.Patient_Name)
 
-    record = input('Please Enter Patient Records: ')
-    record = patient.Patient_Records if record == '' else record
+    record = prompt_default('Please Enter Patient Records: ', patient.Patient_Records)
 
-    phone = input('Please Enter Phone Number: ')
-    phone = patient.Phone_Num if phone == '' else phone
+    phone = prompt_default('Please Enter Phone Number: ', patient.Phone_Num)
 
-    email = input('Please Enter Email: ')
-    email = patient.Email if email == '' else email
+    email = prompt_default('Please Enter Email: ', patient.Email)
 
-    doc_id = input('Please Enter Doctor ID: ')
-    doc_id = patient.Doc_ID if doc_id == '' else doc_id
+    doc_id = prompt_default('Please Enter Doctor ID: ', patient.Doc_ID)
 
-    staff_id = input('Please Enter Staff ID: ')
-    staff_id = patient.Staff_ID if staff_id == '' else staff_id
+    staff_id = prompt_default('Please Enter Staff ID: ', patient.Staff_ID)
 
     external_data = {'Patient_Name': name, 'Patient_Records': record,
         'Phone_Num': phone, 'Email': email, 'Doc_ID': doc_id, 'Staff_ID': staff_id}
 
-    db_staff = db_ops.update_staff(db_session, staff_id, PatientBase(**external_data))
-    print_table(db_staff)
+    db_patient = db_ops.update_patient(db_session, patient_id, PatientBase.model_validate(external_data))
+    print_table(db_patient)
 
 
 def delete_patient(db_session):
     """
     Delete a patient record by ID.
     """
-    print_table(db_ops.get_patients(db_session), False)
-    patient_id = int(input('Please Enter patient id:'))
-    db_patient = db_ops.delete_patient(db_session, patient_id)
-    print_table(db_patient)
+    delete_record(db_session, 'Please Enter patient id:', db_ops.get_patient, db_ops.delete_patient)
 
 
 # Define actions for Test Record management
@@ -397,7 +507,7 @@ def create_test_record(db_session):
     external_data = {'Patient_ID': patient_id, 'Record_Name': name,
             'Test_Date': date, 'Remarks':remark}
 
-    result = db_ops.create_test_record(db_session, TestRecordBase(**external_data))
+    result = db_ops.create_test_record(db_session, TestRecordBase.model_validate(external_data))
     print_table(result)
 
 
@@ -405,7 +515,7 @@ def get_test_records(db_session):
     """
     Display all Test Records from the database.
     """
-    print_table(db_ops.get_test_records(db_session))
+    print_table_paged(db_ops.get_test_records(db_session, limit=None))
 
 
 def get_test_record(db_session):
@@ -424,31 +534,24 @@ def update_test_record(db_session):
     record = db_ops.get_test_record(db_session, record_id)
     print_table(record, False)
 
-    patient_id = input('Please Patient ID: ')
-    patient_id = record.Patient_ID if patient_id == '' else patient_id
+    patient_id = prompt_default('Please Patient ID: ', record.Patient_ID)
 
-    name = input('Please Enter Record Name: ')
-    name = record.Record_Name if name == '' else name
+    name = prompt_default('Please Enter Record Name: ', record.Record_Name)
 
-    date = input('Please Enter Test Date: ')
-    date = record.Test_Date if date == '' else date
+    date = prompt_default('Please Enter Test Date: ', record.Test_Date)
 
-    remarks = input('Please Enter Remarks: ')
-    remarks = record.Remarks if remarks == '' else remarks
+    remarks = prompt_default('Please Enter Remarks: ', record.Remarks)
 
     external_data = {'Patient_ID': patient_id, 'Record_Name': name, 'Test_Date': date, 'Remarks': remarks}
-    db_staff = db_ops.update_staff(db_session, record, TestRecordBase(**external_data))
-    print_table(db_staff)
+    db_record = db_ops.update_test_record(db_session, record_id, TestRecordBase.model_validate(external_data))
+    print_table(db_record)
 
 
 def delete_test_record(db_session):
     """
     Delete a Test record by ID.
     """
-    print_table(db_ops.get_test_records(db_session), False)
-    record_id = int(input('Please Enter Test Record ID:'))
-    db_record = db_ops.delete_test_record(db_session, record_id)
-    print_table(db_record)
+    delete_record(db_session, 'Please Enter Test Record ID:', db_ops.get_test_record, db_ops.delete_test_record)
 
 
 # Define actions for Appointment management
@@ -456,26 +559,25 @@ def create_appointment(db_session):
     """
     Create a new appointment in the database.
     """
+    doc_id = prompt_id('Enter the Doctor ID: ')
+    patient_id = prompt_id('Enter the Patient ID: ')
+    # One query validates both IDs; only the invalid one is asked again
     while True:
-        doc_id = int(input('Enter the Doctor ID: '))
-        if db_ops.get_doctor(db_session, doc_id) is None:
+        doctor, patient_found = db_ops.find_doctor_and_patient(db_session, doc_id, patient_id)
+        if doctor is None:
             print('Invaild Doctor ID')
+            doc_id = prompt_id('Enter the Doctor ID: ')
+        elif not patient_found:
+            print('Invaild Patient ID')
+            patient_id = prompt_id('Enter the Patient ID: ')
         else:
             break
 
-    doctor = db_ops.get_doctor(db_session, doc_id)
     print_table(doctor, False)
 
     while True:
-        patient_id = input('Enter the Patient ID: ')
-        if db_ops.get_patient(db_session, patient_id) is None:
-            print('Invaild Patient ID')
-        else:
-            break
-
-    while True:
-        app_date = input('Enter the Appointment Date (YYYY-MM-DD HH:MM:SS): ')
-        if is_valid_date(app_date):
+        app_date = parse_date(input('Enter the Appointment Date (YYYY-MM-DD HH:MM:SS): '))
+        if app_date is not None:
             break
         else:
             print('Invalid date format. Please enter the date in the format YYYY-MM-DD HH:MM:SS.')
@@ -502,7 +604,8 @@ def create_appointment(db_session):
     external_data = {'Patient_ID': patient_id, 'Doc_ID': doc_id, 'Appointment_Date': app_date,
             'Statusof': status,'Typeof': typeof,'Speciality': speciality, 'Notes':note}
 
-    result = db_ops.create_appointment(db_session, AppointmentBase(**external_data))
+    # Every field was checked by the loops above, so skip pydantic's second validation pass
+    result = db_ops.create_appointment(db_session, AppointmentBase.model_construct(**external_data))
     print_table(result)
 
 
@@ -511,19 +614,19 @@ def create_open_appointment(db_session):
     Create a new open appointment in the database.
     """
     while True:
-        doc_id = int(input('Enter the Doctor ID: '))
-        if db_ops.get_doctor(db_session, doc_id) is None:
+        doc_id = prompt_id('Enter the Doctor ID: ')
+        doctor = db_ops.get_doctor(db_session, doc_id)
+        if doctor is None:
             print('Invaild Doctor ID')
         else:
             break
 
-    doctor = db_ops.get_doctor(db_session, doc_id)
     print_table(doctor, False)
 
     speciality = doctor.Speciality
     while True:
-        appo_date = input('Enter the Appointment Date (YYYY-MM-DD HH:MM:SS): ')
-        if is_valid_date(appo_date):
+        appo_date = parse_date(input('Enter the Appointment Date (YYYY-MM-DD HH:MM:SS): '))
+        if appo_date is not None:
             break
         else:
             print('Invalid date format. Please enter the date in the format YYYY-MM-DD HH:MM:SS.')
@@ -531,7 +634,7 @@ def create_open_appointment(db_session):
     status = 0
     external_data = { 'Doc_ID': doc_id, 'Appointment_Date': appo_date, 'Speciality': speciality, 'Statusof': status}
 
-    result = db_ops.create_appointment(db_session, AppointmentBase(**external_data))
+    result = db_ops.create_appointment(db_session, AppointmentBase.model_construct(**external_data))
     print_table(result)
 
 
@@ -542,7 +645,7 @@ def get_appointments_by_speciality(db_session):
     doctors = db_ops.get_doctors(db_session)
     print_table(doctors, False)
     speciality = input('Please Enter Doctor Speciality: ')
-    print_table(db_ops.get_appointments_by_speciality(db_session, speciality))
+    print_table_paged(db_ops.get_appointments_by_speciality(db_session, speciality))
 
 
 def get_appointment_by_doc_id(db_session):
@@ -550,7 +653,7 @@ def get_appointment_by_doc_id(db_session):
     Retrieve and display a specific Appointment by Doctor ID.
     """
     doc_id = int(input('Please Enter Doctor ID: '))
-    print_table(db_ops.get_appointments_by_doctor_id(db_session, doc_id))
+    print_table_paged(db_ops.get_appointments_by_doctor_id(db_session, doc_id))
 
 
 def get_appointment_by_patient_id(db_session):
@@ -558,7 +661,7 @@ def get_appointment_by_patient_id(db_session):
     Retrieve and display a specific Appointment by Patient ID.
     """
     patient_id = int(input('Please Enter Patient ID: '))
-    print_table(db_ops.get_appointments_by_patient_id(db_session, patient_id))
+    print_table_paged(db_ops.get_appointments_by_patient_id(db_session, patient_id))
 
 
 def update_appointment(db_session):
@@ -569,14 +672,11 @@ def update_appointment(db_session):
     appointment = db_ops.get_appointment(db_session, appointment_id)
     print_table(appointment, False)
 
-    doc_id = input('Please Enter Doctor ID: ')
-    doc_id = appointment.Doc_ID if doc_id == '' else doc_id
+    doc_id = prompt_default('Please Enter Doctor ID: ', appointment.Doc_ID)
 
-    patient_id = input('Please Enter Patient ID: ')
-    patient_id = appointment.Patient_ID if patient_id == '' else patient_id
+    patient_id = prompt_default('Please Enter Patient ID: ', appointment.Patient_ID)
 
-    app_date = input('Please Enter Appointment Date: ')
-    app_date = appointment.Appointment_Date if app_date == '' else app_date
+    app_date = prompt_default('Please Enter Appointment Date: ', appointment.Appointment_Date)
 
     while True:
         status = input('Please Enter Status (0-4 0-Open, 1-Scheduled, 2-Completed, 3-Cancelled, 4-Expired): ')
@@ -595,12 +695,10 @@ def update_appointment(db_session):
 
     speciality = appointment.Speciality
 
-    note = input('Please Enter Note: ')
-    note = appointment.Notes if note == '' else note
+    note = prompt_default('Please Enter Note: ', appointment.Notes)
 
     external_data = {'Doc_ID':doc_id, 'Patient_ID': patient_id, 'Statusof': status, 'Typeof': typeof, 'Speciality': speciality, 'Appointment_Date': app_date, 'Notes': note}
-    db_ops.update_appointment(db_session, appointment_id, AppointmentBase(**external_data))
-    print_table(db_ops.get_appointment(db_session, appointment_id))
+    print_table(db_ops.update_appointment(db_session, appointment_id, AppointmentBase.model_validate(external_data)))
 
 
 def delete_appointment(db_session):
@@ -618,21 +716,20 @@ def create_medical_history(db_session):
     """
     Create a new Medical History in the database.
     """
+    doc_id = prompt_id('Enter the Doctor ID: ')
+    patient_id = prompt_id('Enter the Patient ID: ')
     while True:
-        doc_id = int(input('Enter the Doctor ID: '))
-        if db_ops.get_doctor(db_session, doc_id) is None:
+        doctor, patient_found = db_ops.find_doctor_and_patient(db_session, doc_id, patient_id)
+        if doctor is None:
             print('Invaild Doctor ID')
-        else:
-            break
-
-    while True:
-        patient_id = input('Enter the Patient ID: ')
-        if db_ops.get_patient(db_session, patient_id) is None:
+            doc_id = prompt_id('Enter the Doctor ID: ')
+        elif not patient_found:
             print('Invaild Patient ID')
+            patient_id = prompt_id('Enter the Patient ID: ')
         else:
             break
 
-    record_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    record_date = now()
 
     diagnosis = input('Please Enter the Diagnosis: ')
     treatment = input('Please Enter the Treatment: ')
@@ -640,7 +737,7 @@ def create_medical_history(db_session):
     external_data = {'Patient_ID': patient_id, 'Doc_ID': doc_id, 'Record_Date': record_date,
             'Diagnosis': diagnosis, 'Treatment': treatment}
 
-    result = db_ops.create_medical_history(db_session, MedicalHistoryBase(**external_data))
+    result = db_ops.create_medical_history(db_session, MedicalHistoryBase.model_construct(**external_data))
     print_table(result)
 
 
@@ -649,7 +746,7 @@ def get_medical_history_by_doc_id(db_session):
     Retrieve and display a specific Medical History by Doctor ID.
     """
     doc_id = int(input('Please Enter Doctor ID: '))
-    print_table(db_ops.get_medical_history_by_doctor_id(db_session, doc_id))
+    print_table_paged(db_ops.get_medical_history_by_doctor_id(db_session, doc_id))
 
 
 def get_medical_history_by_patient_id(db_session):
@@ -657,7 +754,7 @@ def get_medical_history_by_patient_id(db_session):
     Retrieve and display a specific Appointment by Patient ID.
     """
     patient_id = int(input('Please Enter Patient ID: '))
-    print_table(db_ops.get_medical_history_by_patient_id(db_session, patient_id))
+    print_table_paged(db_ops.get_medical_history_by_patient_id(db_session, patient_id))
 
 
 def update_medical_history(db_session):
@@ -668,24 +765,18 @@ def update_medical_history(db_session):
     history = db_ops.get_medical_history(db_session, history_id)
     print_table(history, False)
 
-    doc_id = input('Please Enter Doctor ID: ')
-    doc_id = history.Doc_ID if doc_id == '' else doc_id
+    doc_id = prompt_default('Please Enter Doctor ID: ', history.Doc_ID)
 
-    patient_id = input('Please Enter Patient ID: ')
-    patient_id = history.Patient_ID if patient_id == '' else patient_id
+    patient_id = prompt_default('Please Enter Patient ID: ', history.Patient_ID)
 
-    record_date = input('Please Enter Appointment Date: ')
-    record_date = history.Record_Date if record_date == '' else record_date 
+    record_date = prompt_default('Please Enter Appointment Date: ', history.Record_Date)
 
-    diagnosis = input('Please Enter the Diagnosis: ')
-    diagnosis = history.Diagnosis if diagnosis == '' else diagnosis
+    diagnosis = prompt_default('Please Enter the Diagnosis: ', history.Diagnosis)
 
-    treatment = input('Please Enter the Treatment: ')
-    treatment = history.Treatment if treatment == '' else treatment
+    treatment = prompt_default('Please Enter the Treatment: ', history.Treatment)
 
     external_data = {'Doc_ID':doc_id, 'Patient_ID': patient_id, 'Record_Date': record_date, 'Diagnosis': diagnosis, 'Treatment': treatment}
-    db_ops.update_medical_history(db_session, history_id, MedicalHistoryBase(**external_data))
-    print_table(db_ops.get_medical_history(db_session, history_id))
+    print_table(db_ops.update_medical_history(db_session, history_id, MedicalHistoryBase.model_validate(external_data)))
 
 
 def delete_medical_history(db_session):
@@ -710,13 +801,12 @@ def assigne_bed(db_session):
     """
     Assign a Bed to a Patient.
     """
-    bed_id = int(input('Please Enter Bed ID: '))
-    bed = db_ops.get_bed(db_session, bed_id)
-    print_table(bed, False)
-    patient_id = int(input('Please Enter Patient ID: '))
-    external_data = {'Bed_ID': bed.Bed_ID, 'Ward_ID':bed.Ward_ID, 'Patient_ID': patient_id, 'Status': 'Occupied', 'Assigned_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    db_ops.update_bed(db_session, bed_id, BedBase(**external_data))
-    print_table(db_ops.get_bed(db_session, bed_id))
+    bed_id = prompt_id('Please Enter Bed ID: ')
+    patient_id = prompt_id('Please Enter Patient ID: ')
+    bed = db_ops.set_bed_status(db_session, bed_id, 'Occupied', patient_id, now())
+    if bed is None:
+        print('Invaild Bed ID')
+    print_table(bed)
 
 
 def get_occupied_bed(db_session):
@@ -730,13 +820,13 @@ def release_bed(db_session):
     '''
     Release Bed
     '''
-    bed_id = int(input('Please Enter Bed ID: '))
-    bed = db_ops.get_bed(db_session, bed_id)
+    bed_id = prompt_id('Please Enter Bed ID: ')
+    bed = db_ops.set_bed_status(db_session, bed_id, 'Available')
+    if bed is None:
+        print('Invaild Bed ID')
+    else:
+        print('Released.....')
     print_table(bed)
-    print('Released.....')
-    external_data = {'Bed_ID': bed.Bed_ID, 'Ward_ID':bed.Ward_ID, 'Patient_ID': None, 'Status': 'Available', 'Assigned_Date': None}
-    db_ops.update_bed(db_session, bed_id, BedBase(**external_data))
-    print_table(db_ops.get_bed(db_session, bed_id))
 
 # Define actions for Prescription
 def create_prescriptions(db_session):
@@ -747,18 +837,21 @@ def create_prescriptions(db_session):
     doc_id = int(input('Please Enter Doctor ID: '))
     note = input('Please Enter Note: ')
 
-    external_data = {'Patient_ID': patient_id, 'Doctor_ID': doc_id, 'Date_Issued': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'Notes':note}
-    prescription = db_ops.create_prescription(db_session, PrescriptionBase(**external_data))
-
     medication = input('Please Enter Medication: ')
     dosage = input('Please Enter Dosage: ')
     frequency = input('Please Enter Frequuency: ')
     duration = input('Please Enter Duration: ')
 
-    external_data2 = {'Prescription_ID': prescription.Prescription_ID, 'Medication_Name': medication, 'Dosage': dosage, 'Frequency': frequency, 'Duration': duration}
-    db_ops.create_prescription_detail(db_session, PrescriptionDetailBase(**external_data2))
+    external_data = {'Patient_ID': patient_id, 'Doctor_ID': doc_id, 'Date_Issued': now(), 'Notes':note}
 
-    print_table(db_ops.get_prescriptions_by(db_session, 'Prescription.Prescription_ID == value', prescription.Prescription_ID))
+    # Both rows go in with one commit; the detail only needs the flushed Prescription_ID
+    with db_ops.commit_once(db_session):
+        prescription = db_ops.create_prescription(db_session, PrescriptionBase.model_validate(external_data))
+        external_data2 = {'Prescription_ID': prescription.Prescription_ID, 'Medication_Name': medication, 'Dosage': dosage, 'Frequency': frequency, 'Duration': duration}
+        detail = db_ops.create_prescription_detail(db_session, PrescriptionDetailBase.model_validate(external_data2))
+
+    print_table(prescription, False)
+    print_table(detail)
 
 
 def get_prescription(db_session):
@@ -766,7 +859,7 @@ def get_prescription(db_session):
     Lists prescriptions associated with a specific prescription id.
     """
     prescription_id = int(input('Please Enter Prescription ID: '))
-    print_table(db_ops.get_prescriptions_by(db_session, 'Prescription.Prescription_ID == value', prescription_id))
+    print_table(db_ops.get_prescriptions_by(db_session, 'prescription', prescription_id))
 
 
 def list_prescription_by_doc_id(db_session):
@@ -774,7 +867,7 @@ def list_prescription_by_doc_id(db_session):
     Lists prescriptions associated with a specific doctor.
     """
     doc_id = int(input('Please Enter Doctor ID: '))
-    print_table(db_ops.get_prescriptions_by(db_session, 'Prescription.Doctor_ID == value', doc_id))
+    print_table(db_ops.get_prescriptions_by(db_session, 'doctor', doc_id))
 
 
 def list_prescription_by_patient_id(db_session):
@@ -782,7 +875,7 @@ def list_prescription_by_patient_id(db_session):
     Lists prescriptions associated with a specific patient.
     """
     patient_id = int(input('Please Enter Patient ID: '))
-    print_table(db_ops.get_prescriptions_by(db_session, 'Prescription.Doctor_ID == value', patient_id))
+    print_table(db_ops.get_prescriptions_by(db_session, 'patient', patient_id))
 
 
 def list_notification_doctor(db_session):
@@ -811,7 +904,7 @@ def list_notification_patient(db_session):
 
 
 # Function to create a submenu with CRUD operations for each category
-def create_crud_menu(menu_title, create_func, get_all_func, get_func, update_func, delete_func, db_session):
+def create_crud_menu(menu_title, create_func, get_all_func, get_func, update_func, delete_func, args):
     """
     Create a submenu for managing a specific entity with CRUD options.
 
@@ -822,17 +915,102 @@ def create_crud_menu(menu_title, create_func, get_all_func, get_func, update_fun
         get_func: Function for retrieving a specific entity.
         update_func: Function for updating an entity.
         delete_func: Function for deleting an entity.
-        db: Database session.
+        args: Argument list shared by the menu items, holding the database session.
     """
     submenu = ConsoleMenu(menu_title)
-    submenu.append_item(FunctionItem('Create', create_func, [db_session]))
-    submenu.append_item(FunctionItem('Get All', get_all_func, [db_session]))
-    submenu.append_item(FunctionItem('Get', get_func, [db_session]))
-    submenu.append_item(FunctionItem('Update', update_func, [db_session]))
-    submenu.append_item(FunctionItem('Delete', delete_func, [db_session]))
+    submenu.append_item(FunctionItem('Create', create_func, args))
+    submenu.append_item(FunctionItem('Get All', get_all_func, args))
+    submenu.append_item(FunctionItem('Get', get_func, args))
+    submenu.append_item(FunctionItem('Update', update_func, args))
+    submenu.append_item(FunctionItem('Delete', delete_func, args))
     return submenu
 
 
+def _build_test_record_submenu(parent, args):
+    """
+    Build the Test Record submenu shared by the main and patient menus.
+
+    Args:
+        parent: Menu the submenu item belongs to.
+        args: Argument list shared by the menu items, holding the database session.
+    """
+    test_record_menu = create_crud_menu(
+        'Test Record Management',
+        create_test_record,
+        get_test_records,
+        get_test_record,
+        update_test_record,
+        delete_test_record,
+        args
+    )
+    return SubmenuItem('Test Record', test_record_menu, parent)
+
+
+def _build_appointments_submenu(parent, args, with_open=False):
+    """
+    Build the Appointments submenu shared by the main and patient menus.
+
+    Args:
+        parent: Menu the submenu item belongs to.
+        args: Argument list shared by the menu items, holding the database session.
+        with_open: Whether to offer creating open appointments.
+    """
+    appointments_menu = ConsoleMenu('Appointments Management')
+    appointments_menu.append_item(FunctionItem('Create', create_appointment, args))
+    if with_open:
+        appointments_menu.append_item(FunctionItem('Create open Appointment', create_open_appointment, args))
+    appointments_menu.append_item(FunctionItem('Get Appointment by DoctorID', get_appointment_by_doc_id, args))
+    appointments_menu.append_item(FunctionItem('Get Appointment by Speciality', get_appointments_by_speciality, args))
+    appointments_menu.append_item(FunctionItem('Get Appointment by PatientID', get_appointment_by_patient_id, args))
+    appointments_menu.append_item(FunctionItem('Update Appointment', update_appointment, args))
+    appointments_menu.append_item(FunctionItem('Delete Appointment', delete_appointment, args))
+    return SubmenuItem('Appointment', appointments_menu, parent)
+
+
+def _build_history_submenu(parent, args):
+    """
+    Build the Medical History submenu shared by the main and patient menus.
+
+    Args:
+        parent: Menu the submenu item belongs to.
+        args: Argument list shared by the menu items, holding the database session.
+    """
+    history_menu = ConsoleMenu('Medical History Management')
+    history_menu.append_item(FunctionItem('Create', create_medical_history, args))
+    history_menu.append_item(FunctionItem('Get Medical History by DoctorID', get_medical_history_by_doc_id, args))
+    history_menu.append_item(FunctionItem('Get Medical History by PatientID', get_medical_history_by_patient_id, args))
+    history_menu.append_item(FunctionItem('Update', update_medical_history, args))
+    history_menu.append_item(FunctionItem('Delete', delete_medical_history, args))
+    return SubmenuItem('Medical History', history_menu, parent)
+
+
+# Built menu trees by name, as (menu, args, help_args); reused on every later login
+_menus = {}
+
+
+def _show_menu(name, build, db_session: Session, help_data):
+    """
+    Show the menu cached under `name`, building it on first use.
+
+    The items of a built menu all share two argument lists, so a later login
+    only swaps its session and help data into them instead of rebuilding
+    every submenu.
+
+    Args:
+        name: Cache key of the menu.
+        build: Function building the menu from the shared (args, help_args) lists.
+        db_session: Database session of this login.
+        help_data: Parsed help data.
+    """
+    if name not in _menus:
+        args, help_args = [db_session], [db_session, help_data]
+        _menus[name] = (build(args, help_args), args, help_args)
+    menu, args, help_args = _menus[name]
+    args[0] = help_args[0] = db_session
+    help_args[1] = help_data
+    menu.show()
+
+
 # Main function to create the main menu
 def create_main_menu(db_session: Session, help_data):
     """
@@ -841,6 +1019,17 @@ def create_main_menu(db_session: Session, help_data):
     Args:
         db_session: Database session.
     """
+    _show_menu('main', _build_main_menu, db_session, help_data)
+
+
+def _build_main_menu(args, help_args):
+    """
+    Build the main menu tree.
+
+    Args:
+        args: Argument list shared by the menu items, holding the database session.
+        help_args: Argument list of the Help item, holding the session and help data.
+    """
     main_menu = ConsoleMenu('Hospital Management System', 'Please select an option')
 
     # Doctor submenu
@@ -851,13 +1040,13 @@ def create_main_menu(db_session: Session, help_data):
         get_doctor,
         update_doctor,
         delete_doctor,
-        db_session
+        args
     )
-    doctor_menu.append_item(FunctionItem('Create Prescriptions', create_prescriptions, [db_session]))
-    doctor_menu.append_item(FunctionItem('Get Prescriptions by ID', get_prescription, [db_session]))
-    doctor_menu.append_item(FunctionItem('List Prescriptions by Doc_ID', list_prescription_by_doc_id, [db_session]))
-    doctor_menu.append_item(FunctionItem('List Prescriptions by Patient_ID', list_prescription_by_patient_id, [db_session]))
-    doctor_menu.append_item(FunctionItem('Notification', list_notification_doctor, [db_session]))
+    doctor_menu.append_item(FunctionItem('Create Prescriptions', create_prescriptions, args))
+    doctor_menu.append_item(FunctionItem('Get Prescriptions by ID', get_prescription, args))
+    doctor_menu.append_item(FunctionItem('List Prescriptions by Doc_ID', list_prescription_by_doc_id, args))
+    doctor_menu.append_item(FunctionItem('List Prescriptions by Patient_ID', list_prescription_by_patient_id, args))
+    doctor_menu.append_item(FunctionItem('Notification', list_notification_doctor, args))
     doctor_menu_item = SubmenuItem('Doctor', doctor_menu, main_menu)
 
     # Staff submenu
@@ -868,9 +1057,9 @@ def create_main_menu(db_session: Session, help_data):
         get_staff_member,
         update_staff,
         delete_staff,
-        db_session
+        args
     )
-    staff_menu.append_item(FunctionItem('Notification', list_notification_staff, [db_session]))
+    staff_menu.append_item(FunctionItem('Notification', list_notification_staff, args))
     staff_menu_item = SubmenuItem('Staff', staff_menu, main_menu)
 
     # Staff Shift submenu
@@ -881,9 +1070,9 @@ def create_main_menu(db_session: Session, help_data):
         get_staff_shift,
         update_staff_shift,
         delete_staff_shift,
-        db_session
+        args
     )
-    staff_shift_menu.append_item(FunctionItem('Get Staff Shift by Staff ID', get_staff_shift_by_staff_id, [db_session]))
+    staff_shift_menu.append_item(FunctionItem('Get Staff Shift by Staff ID', get_staff_shift_by_staff_id, args))
     staff_shift_menu_item = SubmenuItem('Staff Shift', staff_shift_menu, main_menu)
 
     # Patient submenu
@@ -894,48 +1083,25 @@ def create_main_menu(db_session: Session, help_data):
         get_patient,
         update_patient,
         delete_patient,
-        db_session
+        args
     )
-    patient_menu.append_item(FunctionItem('Notification', list_notification_patient, [db_session]))
+    patient_menu.append_item(FunctionItem('Notification', list_notification_patient, args))
     patient_menu_item = SubmenuItem('Patient', patient_menu, main_menu)
 
     # Test Record submenu
-    test_record_menu = create_crud_menu(
-        'Test Record Management',
-        create_test_record,
-        get_test_records,
-        get_test_record,
-        update_test_record,
-        delete_test_record,
-        db_session
-    )
-    test_record_menu_item = SubmenuItem('Test Record', test_record_menu, main_menu)
+    test_record_menu_item = _build_test_record_submenu(main_menu, args)
 
     # Appointments submenu
-    appointments_menu = ConsoleMenu('Appointments Management')
-    appointments_menu.append_item(FunctionItem('Create', create_appointment, [db_session]))
-    appointments_menu.append_item(FunctionItem('Create open Appointment', create_open_appointment, [db_session]))
-    appointments_menu.append_item(FunctionItem('Get Appointment by DoctorID', get_appointment_by_doc_id, [db_session]))
-    appointments_menu.append_item(FunctionItem('Get Appointment by Speciality', get_appointments_by_speciality, [db_session]))
-    appointments_menu.append_item(FunctionItem('Get Appointment by PatientID', get_appointment_by_patient_id, [db_session]))
-    appointments_menu.append_item(FunctionItem('Update Appointment', update_appointment, [db_session]))
-    appointments_menu.append_item(FunctionItem('Delete Appointment', delete_appointment, [db_session]))
-    appointments_menu_item = SubmenuItem('Appointment', appointments_menu, main_menu)
+    appointments_menu_item = _build_appointments_submenu(main_menu, args, with_open=True)
 
     # Medical Histroy submenu
-    history_menu = ConsoleMenu('Medical History Management')
-    history_menu.append_item(FunctionItem('Create', create_medical_history, [db_session]))
-    history_menu.append_item(FunctionItem('Get Medical History by DoctorID', get_medical_history_by_doc_id, [db_session]))
-    history_menu.append_item(FunctionItem('Get Medical History by PatientID', get_medical_history_by_patient_id, [db_session]))
-    history_menu.append_item(FunctionItem('Update', update_medical_history, [db_session]))
-    history_menu.append_item(FunctionItem('Delete', delete_medical_history, [db_session]))
-    history_menu_item = SubmenuItem('Medical History', history_menu, main_menu)
+    history_menu_item = _build_history_submenu(main_menu, args)
 
     bed_menu = ConsoleMenu('Bed Management')
-    bed_menu.append_item(FunctionItem('list available Bed', get_available_bed, [db_session]))
-    bed_menu.append_item(FunctionItem('list occupied Bed', get_occupied_bed, [db_session]))
-    bed_menu.append_item(FunctionItem('Assign bed to patient', assigne_bed, [db_session]))
-    bed_menu.append_item(FunctionItem('Release bed', release_bed, [db_session]))
+    bed_menu.append_item(FunctionItem('list available Bed', get_available_bed, args))
+    bed_menu.append_item(FunctionItem('list occupied Bed', get_occupied_bed, args))
+    bed_menu.append_item(FunctionItem('Assign bed to patient', assigne_bed, args))
+    bed_menu.append_item(FunctionItem('Release bed', release_bed, args))
     bed_menu_item = SubmenuItem('Bed Management', bed_menu, main_menu)
 
     # Add submenus to main menu
@@ -949,10 +1115,8 @@ def create_main_menu(db_session: Session, help_data):
     main_menu.append_item(bed_menu_item)
 
     # Help menu item
-    main_menu.append_item(FunctionItem("Help", display_help, [db_session, help_data]))
-
-    # Show the menu
-    main_menu.show()
+    main_menu.append_item(FunctionItem("Help", display_help, help_args))
+    return main_menu
 
 def create_patient_menu(db_session: Session, help_data):
     """
@@ -961,38 +1125,27 @@ def create_patient_menu(db_session: Session, help_data):
     Args:
         db_session: Database session.
     """
+    _show_menu('patient', _build_patient_menu, db_session, help_data)
+
+
+def _build_patient_menu(args, help_args):
+    """
+    Build the patient menu tree.
+
+    Args:
+        args: Argument list shared by the menu items, holding the database session.
+        help_args: Argument list of the Help item, holding the session and help data.
+    """
     main_menu = ConsoleMenu('patient menu', 'Please select an option')
 
     # Test Record submenu
-    test_record_menu = create_crud_menu(
-        'Test Record Management',
-        create_test_record,
-        get_test_records,
-        get_test_record,
-        update_test_record,
-        delete_test_record,
-        db_session
-    )
-    test_record_menu_item = SubmenuItem('Test Record', test_record_menu, main_menu)
+    test_record_menu_item = _build_test_record_submenu(main_menu, args)
 
     # Appointments submenu
-    appointments_menu = ConsoleMenu('Appointments Management')
-    appointments_menu.append_item(FunctionItem('Create', create_appointment, [db_session]))
-    appointments_menu.append_item(FunctionItem('Get Appointment by Speciality', get_appointments_by_speciality, [db_session]))
-    appointments_menu.append_item(FunctionItem('Get Appointment by DoctorID', get_appointment_by_doc_id, [db_session]))
-    appointments_menu.append_item(FunctionItem('Get Appointment by PatientID', get_appointment_by_patient_id, [db_session]))
-    appointments_menu.append_item(FunctionItem('Update Appointment', update_appointment, [db_session]))
-    appointments_menu.append_item(FunctionItem('Delete Appointment', delete_appointment, [db_session]))
-    appointments_menu_item = SubmenuItem('Appointment', appointments_menu, main_menu)
+    appointments_menu_item = _build_appointments_submenu(main_menu, args)
 
     # Medical Histroy submenu
-    history_menu = ConsoleMenu('Medical History Management')
-    history_menu.append_item(FunctionItem('Create', create_medical_history, [db_session]))
-    history_menu.append_item(FunctionItem('Get Medical History by DoctorID', get_medical_history_by_doc_id, [db_session]))
-    history_menu.append_item(FunctionItem('Get Medical History by PatientID', get_medical_history_by_patient_id, [db_session]))
-    history_menu.append_item(FunctionItem('Update', update_medical_history, [db_session]))
-    history_menu.append_item(FunctionItem('Delete', delete_medical_history, [db_session]))
-    history_menu_item = SubmenuItem('Medical History', history_menu, main_menu)
+    history_menu_item = _build_history_submenu(main_menu, args)
 
     # Add submenus to main menu
     main_menu.append_item(test_record_menu_item)
@@ -1000,19 +1153,29 @@ def create_patient_menu(db_session: Session, help_data):
     main_menu.append_item(history_menu_item)
 
     # Help menu item
-    main_menu.append_item(FunctionItem("Help", display_help, [db_session, help_data]))
+    main_menu.append_item(FunctionItem("Help", display_help, help_args))
+    return main_menu
+
+@functools.lru_cache(maxsize=1)
+def _login_system():
+    """
+    The LoginSystem shared by every login, opened on first use.
+
+    Its SQLite connection, pragmas and schema check are set up once
+    instead of on each login attempt.
+    """
+    return LoginSystem(db_path='login/login.db')
 
-    # Show the menu
-    main_menu.show()
 
 def login():
     """Handles user login"""
+    from pwinput import pwinput
+
     print("\n=== User Login ===")
     username = input("Enter UserName: ")
-    password = pwinput.pwinput(prompt='Enter Password: ', mask='*')
+    password = pwinput(prompt='Enter Password: ', mask='*')
 
-    login_system = LoginSystem(db_path='login/login.db')
-    _, role = login_system.login_user(username, password)
+    _, role = _login_system().login_user(username, password)
 
     if role is not None:
         help_data = load_help_data("help_qa.json")
@@ -1023,52 +1186,71 @@ def login():
 def patient_login():
     """Handles patient login"""
     print("\n=== Patient Login by patientid ===")
-    userid = input("Enter patientid: ")
+    userid = prompt_id("Enter patientid: ")
 
     # check if the patient id exists
     with get_db_cli() as db:
-        patient = db_ops.get_patient(db, userid)
-        if patient is None:
+        patient_name = db_ops.get_patient_name(db, userid)
+        if patient_name is None:
             print("Error: Invalid Patient ID")
             time.sleep(1)
             return
         else:
-            print("Welcome, ", patient.Patient_Name)
-            time.sleep(1)
+            print("Welcome, ", patient_name)
             help_data = load_help_data("help_qa.json")
             create_patient_menu(db, help_data)
 
 
 def load_help_data(file_path):
     try:
-        with open(file_path, 'r') as file:
-            data = json.load(file)
+        # Reuse the parsed file across logins until it is edited on disk
+        mtime = os.stat(file_path).st_mtime_ns
+        cached = _help_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(file_path, 'rb') as file:
+            data = orjson.loads(file.read())
             #print("Loaded help data:", data)  # Debug print
-            return data
+        # Wrap each query once so every run reuses the same TextClause
+        for category in data.get("questions", []):
+            for question in category.get("questions", []):
+                if isinstance(question.get("query"), str):
+                    question["query"] = text(question["query"])
+            # The listings never change after loading, so format them once for display_help
+            category["_menu_text"] = "\n".join(
+                f"  {q_idx}. {question['question']}"
+                for q_idx, question in enumerate(category.get("questions", []), start=1))
+        data["_menu_text"] = "\n".join(
+            f"{idx}. {category['category']}" for idx, category in enumerate(data.get("questions", []), start=1))
+        _help_cache[file_path] = (mtime, data)
+        return data
     except FileNotFoundError:
         print("Error: Help data file not found.")
         return {"questions": []}
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Error decoding JSON: {e}")
         return {"questions": []}
     
 def execute_query(db_session, query):
     try:
         # Execute the query
-        result_proxy = db_session.execute(text(query))
+        if isinstance(query, str):
+            query = text(query)
+        result_proxy = db_session.execute(query)
         results = result_proxy.fetchall()  # Fetch all results
 
         if results:
             # Get column names from the result (this works dynamically based on the query)
             column_names = result_proxy.keys()
 
+            from prettytable import PrettyTable
+
             # Create a PrettyTable instance and set field names to column names dynamically
             table = PrettyTable()
             table.field_names = column_names  # Set table headers dynamically based on query result
 
             # Add rows to the table
-            for row in results:
-                table.add_row(row)
+            table.add_rows(results)
 
             print(table)
         else:
@@ -1089,8 +1271,8 @@ def display_help(db_session, help_data):
     while True:
         print("\n=== Help Menu ===")
         categories = help_data.get("questions", [])
-        for idx, category in enumerate(categories, start=1):
-            print(f"{idx}. {category['category']}")
+        if categories:
+            print(help_data["_menu_text"])
 
         print("0. Return to Main Menu")
         try:
@@ -1102,8 +1284,8 @@ def display_help(db_session, help_data):
                 category = categories[category_idx]
                 questions = category.get("questions", [])
                 print(f"\nCategory: {category['category']}")
-                for q_idx, question in enumerate(questions, start=1):
-                    print(f"  {q_idx}. {question['question']}")
+                if questions:
+                    print(category["_menu_text"])
 
                 print("  0. Return to Category Selection")
                 question_idx = int(input("\nSelect a question by index: ")) - 1
@@ -2,6 +2,7 @@
 This module defines the SQLAlchemy ORM models for a healthcare database.
 
 Classes:
+    DictMixin: Provides `as_dict` and `dicts` for every model.
     Doctor: Represents doctors in the healthcare system.
     Staff: Represents staff members in the healthcare system.
     Patient: Represents patients and their association with doctors and staff.
@@ -16,14 +17,48 @@ Classes:
 Each class corresponds to a table in the database, with relationships defined
 between doctors, staff, patients, and test records.
 """
+import functools
+import operator
 from datetime import datetime
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, func, select
 
 from database import Base
 
 
-class Doctor(Base):
+class DictMixin:
+    """
+    Shared `as_dict` for the models below.
+    """
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _column_getter(cls):
+        """
+        Column names of the table and an attrgetter reading them all, built once per class.
+        """
+        names = tuple(c.name for c in cls.__table__.columns)
+        return names, operator.attrgetter(*names)
+
+    def as_dict(self):
+        """
+        Convert to Dict
+        """
+        names, getter = self._column_getter()
+        return dict(zip(names, getter(self)))
+
+    @classmethod
+    def dicts(cls, session, **filters):
+        """
+        Read matching rows as dict-like mappings straight from the table, skipping ORM instances.
+
+        Args:
+            session: Database session.
+            **filters: Column values to match, as for `filter_by`.
+        """
+        return session.execute(select(cls.__table__).filter_by(**filters)).mappings().all()
+
+
+class Doctor(DictMixin, Base):
     """
     Represents a doctor in the healthcare system.
 
@@ -45,14 +80,8 @@ class Doctor(Base):
 
     patients = relationship("Patient", back_populates="doctor")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
-
 
-class Staff(Base):
+class Staff(DictMixin, Base):
     """
     Represents a staff member in the healthcare system.
 
@@ -74,13 +103,8 @@ class Staff(Base):
 
     patients = relationship("Patient", back_populates="staff")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
 
-class StaffShift(Base):
+class StaffShift(DictMixin, Base):
     """
     Represents a staff shift in the healthcare system.
 
@@ -92,6 +116,9 @@ class StaffShift(Base):
         Staff (relationship): Relationship to the `Staff` table.
     """
     __tablename__ = "StaffShifts"
+    __table_args__ = (
+        Index("ix_shift_staff", "Staff_ID"),
+    )
 
     Shift_ID = Column(Integer, primary_key=True, index=True)
     Staff_ID = Column(Integer, ForeignKey("Staff.Staff_ID"))
@@ -100,14 +127,8 @@ class StaffShift(Base):
 
     staff = relationship("Staff", backref="staffshifts")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
-
 
-class Patient(Base):
+class Patient(DictMixin, Base):
     """
     Represents a patient in the healthcare system.
 
@@ -137,14 +158,8 @@ class Patient(Base):
     staff = relationship("Staff", back_populates="patients")
     test_records = relationship("TestRecord", back_populates="patient")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
-
 
-class TestRecord(Base):
+class TestRecord(DictMixin, Base):
     """
     Represents a test record associated with a patient.
 
@@ -157,6 +172,9 @@ class TestRecord(Base):
         patient (relationship): Relationship to the `Patient` table.
     """
     __tablename__ = "Test_Records"
+    __table_args__ = (
+        Index("ix_test_patient", "Patient_ID"),
+    )
 
     Record_ID = Column(Integer, primary_key=True, index=True)
     Patient_ID = Column(Integer, ForeignKey("Patients.Patient_ID"))
@@ -166,13 +184,8 @@ class TestRecord(Base):
 
     patient = relationship("Patient", back_populates="test_records")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
 
-class Appointment(Base):
+class Appointment(DictMixin, Base):
     """
     Represents an appointment in the healthcare system.
 
@@ -188,6 +201,11 @@ class Appointment(Base):
         patient (relationship): Relationship to the `Patient` table.
     """
     __tablename__ = "Appointments"
+    __table_args__ = (
+        Index("ix_appt_doc_date", "Doc_ID", "Appointment_Date"),
+        Index("ix_appt_patient", "Patient_ID"),
+        Index("ix_appt_spec", "Speciality"),
+    )
 
     Appointment_ID = Column(Integer, primary_key=True, index=True)
     Patient_ID = Column(Integer, ForeignKey("Patients.Patient_ID"))
@@ -201,17 +219,12 @@ class Appointment(Base):
     patient = relationship("Patient", back_populates="appointments")
     doctor = relationship("Doctor", back_populates="appointments")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
 
 Doctor.appointments = relationship("Appointment", back_populates="doctor")
 Patient.appointments = relationship("Appointment", back_populates="patient")
 
 
-class MedicalHistory(Base):
+class MedicalHistory(DictMixin, Base):
     """
     Represents Medical History in the healthcare system.
 
@@ -227,6 +240,10 @@ class MedicalHistory(Base):
         patient (relationship): Relationship to the `Patient` table.
     """
     __tablename__ = 'MedicalHistory'
+    __table_args__ = (
+        Index("ix_mh_doc", "Doc_ID"),
+        Index("ix_mh_patient", "Patient_ID"),
+    )
     History_ID = Column(Integer, primary_key=True, autoincrement=True)
     Patient_ID = Column(Integer, ForeignKey('Patients.Patient_ID'), nullable=False)
     Doc_ID = Column(Integer, ForeignKey('Doctors.Doc_ID'), nullable=False)
@@ -237,13 +254,8 @@ class MedicalHistory(Base):
     patient = relationship("Patient", backref="medical_history")
     doctor = relationship("Doctor", backref="medical_history")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
 
-class Ward(Base):
+class Ward(DictMixin, Base):
     """
     Represents Ward in the Hospital.
 
@@ -261,13 +273,8 @@ class Ward(Base):
 
     beds = relationship("Bed", back_populates="ward")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
 
-class Bed(Base):
+class Bed(DictMixin, Base):
     """
     Represents Beds in the Hospital.
 
@@ -282,6 +289,10 @@ class Bed(Base):
         patient (relationship): Relationship to the `Patient` table.
     """
     __tablename__ = 'Beds'
+    __table_args__ = (
+        Index("ix_bed_status", "Status"),
+        Index("ix_bed_patient", "Patient_ID"),
+    )
     Bed_ID = Column(Integer, primary_key=True, autoincrement=True)
     Ward_ID = Column(Integer, ForeignKey('Wards.Ward_ID'), nullable=False)
     Patient_ID = Column(Integer, ForeignKey('Patients.Patient_ID'))
@@ -291,14 +302,8 @@ class Bed(Base):
     ward = relationship("Ward", back_populates="beds")
     patient = relationship("Patient", backref="bed")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
-
 
-class Prescription(Base):
+class Prescription(DictMixin, Base):
     """
     Represents a medical prescription issued by a doctor to a patient.
 
@@ -312,6 +317,10 @@ class Prescription(Base):
             the list of detailed medications prescribed under this prescription.
     """
     __tablename__ = "Prescriptions"
+    __table_args__ = (
+        Index("ix_rx_doc", "Doctor_ID"),
+        Index("ix_rx_patient", "Patient_ID"),
+    )
     Prescription_ID = Column(Integer, primary_key=True, autoincrement=True, index=True)
     Patient_ID = Column(Integer, ForeignKey("Patients.Patient_ID"), nullable=False)
     Doctor_ID = Column(Integer, ForeignKey("Doctors.Doc_ID"), nullable=False)
@@ -321,14 +330,8 @@ class Prescription(Base):
     # Relationships
     details = relationship("PrescriptionDetail", back_populates="prescription")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
-
 
-class PrescriptionDetail(Base):
+class PrescriptionDetail(DictMixin, Base):
     """
     Represents the detailed information of medications under a specific prescription.
 
@@ -341,6 +344,9 @@ class PrescriptionDetail(Base):
         Duration (str): The length of time the medication should be taken (e.g., '7 days').
     """
     __tablename__ = "Prescription_Details"
+    __table_args__ = (
+        Index("ix_rx_detail_rx", "Prescription_ID"),
+    )
     Detail_ID = Column(Integer, primary_key=True, autoincrement=True)
     Prescription_ID = Column(Integer, ForeignKey("Prescriptions.Prescription_ID"), nullable=False)
     Medication_Name = Column(String(100), nullable=False)
@@ -351,14 +357,8 @@ class PrescriptionDetail(Base):
     # Relationships
     prescription = relationship("Prescription", back_populates="details")
 
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
 
-
-class Notification(Base):
+class Notification(DictMixin, Base):
     """
     Represents the detailed information of notifications for doctors, patients, and staff.
 
@@ -372,17 +372,16 @@ class Notification(Base):
         Read_At (datetime, optional): The timestamp when the notification was marked as read.
     """
     __tablename__ = "Notifications"
+    __table_args__ = (
+        Index("ix_notif_recipient", "Recipient_Type", "Recipient_ID", "Status"),
+    )
+    # Fetch Created_At back in the INSERT's OUTPUT clause instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     Notification_ID = Column(Integer, primary_key=True, autoincrement=True)
     Recipient_Type = Column(String(15), nullable=False)
     Recipient_ID = Column(Integer, nullable=False)
     Message = Column(String, nullable=False)
     Status = Column(String(15), default="Unread", nullable=False)
-    Created_At = Column(DateTime, default=datetime.now, nullable=False)
+    Created_At = Column(DateTime, server_default=func.now(), nullable=False)
     Read_At = Column(DateTime, nullable=True)
-
-    def as_dict(self):
-        """
-        Convert to Dict
-        """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
\ No newline at end of file
@@ -4,9 +4,43 @@ It includes schemas for Doctors, Staff, Patients, and Test Records, each
 with their respective base, create, and read models for API integration.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from typing import Annotated, Literal, Optional
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, StringConstraints
+
+# Shared aliases for the optional column types repeated across the schemas below
+OptStr = Optional[str]
+OptInt = Optional[int]
+OptDT = Optional[datetime]
+
+# Shape check only (something@domain.tld); avoids importing email-validator
+EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+EmailAddress = Annotated[str, StringConstraints(pattern=EMAIL_RE, max_length=254)]
+
+# Closed vocabularies of the status/type columns
+RecipientType = Literal["Doctor", "Patient", "Staff"]
+NotificationStatus = Literal["Unread", "Read"]
+BedStatus = Literal["Available", "Occupied"]
+
+
+class ORMModel(BaseModel):
+    """
+    Shared parent of the schemas read from ORM objects; they are never mutated once built.
+
+    Validators are built on first use, so processes that never read a
+    given record type (e.g. the CLI) don't pay for its schema at import.
+    """
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='forbid', defer_build=True)
+
+
+class CreateModel(BaseModel):
+    """
+    Shared parent of the Create schemas; unknown fields are rejected instead of silently ignored.
+    """
+    model_config = ConfigDict(extra='forbid')
+
 
 # Doctors schemas
 class DoctorBase(BaseModel):
@@ -17,21 +51,21 @@ class DoctorBase(BaseModel):
         Doc_Name (str): Name of the doctor.
         Speciality (str): Specialization of the doctor.
         Phone_Num (Optional[str]): Phone number of the doctor (optional).
-        Email (EmailStr): Email address of the doctor.
+        Email (EmailAddress): Email address of the doctor.
     """
     Doc_Name: str
     Speciality: str
-    Phone_Num: Optional[str] = None
-    Email: EmailStr
+    Phone_Num: OptStr = None
+    Email: EmailAddress
 
-class DoctorCreate(DoctorBase):
+class DoctorCreate(DoctorBase, CreateModel):
     """
     Schema for creating a new Doctor record.
     Inherits all attributes from DoctorBase.
     """
     pass
 
-class DoctorRead(DoctorBase):
+class DoctorRead(DoctorBase, ORMModel):
     """
     Schema for reading a Doctor record.
 
@@ -39,8 +73,6 @@ class DoctorRead(DoctorBase):
         Doc_ID (int): Unique identifier of the doctor.
     """
     Doc_ID: int
-    class Config:
-        from_attributes = True
 
 # Staff schemas
 class StaffBase(BaseModel):
@@ -50,26 +82,23 @@ class StaffBase(BaseModel):
     Attributes:
         Name (str): Name of the staff member.
         Department (str): Department the staff member belongs to.
-        Email (EmailStr): Email address of the staff member.
+        Email (EmailAddress): Email address of the staff member.
         Hire_Date (datetime): Date of hire for the staff member.
     """
     Name: str
     Department: str
-    Email: EmailStr
+    Email: EmailAddress
     Hire_Date: datetime
 
-class StaffCreate(StaffBase):
+class StaffCreate(StaffBase, CreateModel):
     """
     Schema for creating a new Staff record.
     Inherits all attributes from StaffBase.
     """
-    Name: str
-    Department: str 
-    Email: EmailStr
-    Hire_Date: datetime
+    pass
 
 
-class StaffRead(StaffBase):
+class StaffRead(StaffBase, ORMModel):
     """
     Schema for reading a Staff record.
 
@@ -77,8 +106,6 @@ class StaffRead(StaffBase):
         Staff_ID (int): Unique identifier of the staff member.
     """
     Staff_ID: int
-    class Config:
-        from_attributes = True
 
 class StaffShiftBase(BaseModel):
     """
@@ -93,16 +120,14 @@ class StaffShiftBase(BaseModel):
     Shift_Start: datetime
     Shift_End: datetime
 
-class StaffShiftCreate(StaffShiftBase):
+class StaffShiftCreate(StaffShiftBase, CreateModel):
     """
     Schema for creating a new StaffShift record.
     Inherits all attributes from StaffShiftBase.
     """
-    Staff_ID: int
-    Shift_Start: datetime
-    Shift_End: datetime
+    pass
 
-class StaffShiftRead(StaffShiftBase):
+class StaffShiftRead(StaffShiftBase, ORMModel):
     """
     Schema for reading a StaffShift record.
 
@@ -110,10 +135,8 @@ class StaffShiftRead(StaffShiftBase):
         Shift_ID (int): Unique identifier of the staff shift.
     """
     Shift_ID: int
-    class Config:
-        from_attributes = True
 
-class StaffShiftUpdate(StaffShiftBase):
+class StaffShiftUpdate(StaffShiftBase, CreateModel):
     """
     Schema for updating a StaffShift record.
 
@@ -121,10 +144,6 @@ class StaffShiftUpdate(StaffShiftBase):
         Shift_ID (int): Unique identifier of the staff shift.
     """
     Shift_ID: int
-    Shift_Start: datetime
-    Shift_End: datetime
-    class Config:
-        from_attributes = True
 
 
 
@@ -137,25 +156,25 @@ class PatientBase(BaseModel):
         Patient_Name (str): Name of the patient.
         Patient_Records (str): Medical records of the patient.
         Phone_Num (Optional[str]): Phone number of the patient (optional).
-        Email (EmailStr): Email address of the patient.
+        Email (EmailAddress): Email address of the patient.
         Doc_ID (Optional[int]): ID of the doctor assigned to the patient (optional).
         Staff_ID (Optional[int]): ID of the staff assigned to the patient (optional).
     """
     Patient_Name: str
     Patient_Records: str
-    Phone_Num: Optional[str] = None
-    Email: EmailStr
-    Doc_ID: Optional[int] = None
-    Staff_ID: Optional[int] = None
+    Phone_Num: OptStr = None
+    Email: EmailAddress
+    Doc_ID: OptInt = None
+    Staff_ID: OptInt = None
 
-class PatientCreate(PatientBase):
+class PatientCreate(PatientBase, CreateModel):
     """
     Schema for creating a new Patient record.
     Inherits all attributes from PatientBase.
     """
     pass
 
-class PatientRead(PatientBase):
+class PatientRead(PatientBase, ORMModel):
     """
     Schema for reading a Patient record.
 
@@ -163,8 +182,6 @@ class PatientRead(PatientBase):
         Patient_ID (int): Unique identifier of the patient.
     """
     Patient_ID: int
-    class Config:
-        from_attributes = True
 
 # TestRecords schemas
 class TestRecordBase(BaseModel):
@@ -178,11 +195,11 @@ class TestRecordBase(BaseModel):
         Remarks (Optional[str]): Additional remarks for the test record (optional).
     """
     Patient_ID: int
-    Record_Name: Optional[str] = None
-    Test_Date: Optional[datetime] = None
-    Remarks: Optional[str] = None
+    Record_Name: OptStr = None
+    Test_Date: OptDT = None
+    Remarks: OptStr = None
 
-class TestRecordCreate(TestRecordBase):
+class TestRecordCreate(TestRecordBase, CreateModel):
     """
     Schema for creating a new Test Record.
     Inherits all attributes from TestRecordBase.
@@ -190,7 +207,7 @@ class TestRecordCreate(TestRecordBase):
     pass
 
 
-class TestRecordRead(TestRecordBase):
+class TestRecordRead(TestRecordBase, ORMModel):
     """
     Schema for reading a Test Record.
 
@@ -198,8 +215,6 @@ class TestRecordRead(TestRecordBase):
         Record_ID (int): Unique identifier of the test record.
     """
     Record_ID: int
-    class Config:
-        from_attributes = True
 
 # Appointments schemas
 class AppointmentBase(BaseModel):
@@ -213,28 +228,28 @@ class AppointmentBase(BaseModel):
         Status (int): Status of Appointment.
         Notes (str): Note of Appointment.
     """
-    Patient_ID: Optional[int] = None
+    Patient_ID: OptInt = None
     Doc_ID: int
     Appointment_Date: datetime
-    Statusof: Optional[int] = None
-    Typeof: Optional[str] = None
+    Statusof: OptInt = None
+    Typeof: OptStr = None
     Speciality: str
-    Notes: Optional[str] = None
+    Notes: OptStr = None
 
 
-class AppointmentCreate(AppointmentBase):
+class AppointmentCreate(AppointmentBase, CreateModel):
     """
     Schema for creating a new Appointment record.
 
     Attributes:
-        Doctor_ID (int): ID of the doctor assigned to the appointment.
-        Patient_ID (int): ID of the patient assigned to the appointment.
+        Doc_ID (int): ID of the doctor assigned to the appointment; also accepted as Doctor_ID.
+        Patient_ID (int): ID of the patient assigned to the appointment (required here).
     """
-    Doctor_ID: int
+    Doc_ID: int = Field(validation_alias=AliasChoices("Doc_ID", "Doctor_ID"))
     Patient_ID: int
 
 
-class AppointmentRead(AppointmentBase):
+class AppointmentRead(AppointmentBase, ORMModel):
     """
     Schema for reading an Appointment record.
 
@@ -242,8 +257,6 @@ class AppointmentRead(AppointmentBase):
         Appointment_ID (int): Unique identifier of the appointment.
     """
     Appointment_ID: int
-    class Config:
-        from_attributes = True
 
 
 # Medical History schemas
@@ -260,24 +273,22 @@ class MedicalHistoryBase(BaseModel):
     Patient_ID: int
     Doc_ID: int
 
-    Diagnosis: Optional[str] = None
-    Treatment: Optional[str] = None
+    Diagnosis: OptStr = None
+    Treatment: OptStr = None
     Record_Date: datetime
 
 
-class MedicalHistoryCreate(MedicalHistoryBase):
+class MedicalHistoryCreate(MedicalHistoryBase, CreateModel):
     """
     Schema for creating a new Medical History record.
 
     Attributes:
-        Doctor_ID (int): ID of the doctor assigned to the Medical History.
-        Patient_ID (int): ID of the patient assigned to the Medical History.
+        Doc_ID (int): ID of the doctor assigned to the Medical History; also accepted as Doctor_ID.
     """
-    Doctor_ID: int
-    Patient_ID: int
+    Doc_ID: int = Field(validation_alias=AliasChoices("Doc_ID", "Doctor_ID"))
 
 
-class MedicalHistoryRead(MedicalHistoryBase):
+class MedicalHistoryRead(MedicalHistoryBase, ORMModel):
     """
     Schema for reading an MedicalHistory record.
 
@@ -285,8 +296,6 @@ class MedicalHistoryRead(MedicalHistoryBase):
         History_ID (int): Unique identifier of the MedicalHistory.
     """
     History_ID: int
-    class Config:
-        from_attributes = True
 
 
 # Medical Beds schemas
@@ -298,17 +307,17 @@ class BedBase(BaseModel):
         Bed_ID (int): ID of Bed.
         Ward_ID (int): Ward ID of Bed.
         Patient_ID (Optional[int]): ID of the patient.
-        Status (str): Status of Bed.
+        Status (BedStatus): Status of Bed ('Available', 'Occupied').
         Assigned_Date (datetime): Date and time of the Assigned.
     """
     Bed_ID: int
     Ward_ID: int
-    Patient_ID: Optional[int] = None
-    Status: str
-    Assigned_Date: Optional[datetime] = None
+    Patient_ID: OptInt = None
+    Status: BedStatus
+    Assigned_Date: OptDT = None
 
 
-class BedCreate(BedBase):
+class BedCreate(BedBase, CreateModel):
     """
     Schema for creating a new Bed record.
 
@@ -316,11 +325,10 @@ class BedCreate(BedBase):
         Bed_ID (int): ID of the Bed.
         Ward_ID (int): ID of the ward where the bed is located.
     """
-    Bed_ID: int
-    Ward_ID: int
+    pass
 
 
-class BedRead(BedBase):
+class BedRead(BedBase, ORMModel):
     """
     Schema for reading an Bed record.
 
@@ -328,8 +336,6 @@ class BedRead(BedBase):
         Appointment_ID (int): Unique identifier of the MedicalHistory.
     """
     Bed_ID: int
-    class Config:
-        from_attributes = True
 
 
 class PrescriptionBase(BaseModel):
@@ -346,10 +352,10 @@ class PrescriptionBase(BaseModel):
     Patient_ID: int
     Doctor_ID: int
     Date_Issued: datetime
-    Notes: Optional[str] = None
+    Notes: OptStr = None
 
 
-class PrescriptionCreate(PrescriptionBase):
+class PrescriptionCreate(PrescriptionBase, CreateModel):
     """
     Schema for creating a new Prescription record.
 
@@ -357,13 +363,10 @@ class PrescriptionCreate(PrescriptionBase):
         Patient_ID (int): ID of the patient receiving the prescription.
         Doctor_ID (int): ID of the doctor issuing the prescription.
     """
-    Patient_ID: int
-    Doctor_ID: int
-    Date_Issued: datetime
-    Notes: Optional[str] = None
+    pass
 
 
-class PrescriptionRead(PrescriptionBase):
+class PrescriptionRead(PrescriptionBase, ORMModel):
     """
     Schema for reading a Prescription record.
 
@@ -371,8 +374,6 @@ class PrescriptionRead(PrescriptionBase):
         Prescription_ID (int): Unique identifier for the prescription.
     """
     Prescription_ID: int
-    class Config:
-        from_attributes = True
 
 
 class PrescriptionDetailBase(BaseModel):
@@ -394,21 +395,17 @@ class PrescriptionDetailBase(BaseModel):
     Duration: str
 
 
-class PrescriptionDetailCreate(PrescriptionDetailBase):
+class PrescriptionDetailCreate(PrescriptionDetailBase, CreateModel):
     """
     Schema for creating a new PrescriptionDetail record.
 
     Attributes:
         Prescription_ID (int): Foreign key referencing the parent Prescription record.
     """
-    Prescription_ID: int
-    Medication_Name: str
-    Dosage: str
-    Frequency: str
-    Duration: str
+    pass
 
 
-class PrescriptionDetailRead(PrescriptionDetailBase):
+class PrescriptionDetailRead(PrescriptionDetailBase, ORMModel):
     """
     Schema for reading a PrescriptionDetail record.
 
@@ -416,8 +413,6 @@ class PrescriptionDetailRead(PrescriptionDetailBase):
         Detail_ID (int): Unique identifier for the prescription detail.
     """
     Detail_ID: int
-    class Config:
-        from_attributes = True
 
 
 class NotificationBase(BaseModel):
@@ -426,37 +421,37 @@ class NotificationBase(BaseModel):
 
     Attributes:
         Notification_ID (int): Unique identifier for the notification.
-        Recipient_Type (str): Type of recipient ('Doctor', 'Patient', 'Staff').
+        Recipient_Type (RecipientType): Type of recipient ('Doctor', 'Patient', 'Staff').
         Recipient_ID (int): ID of the recipient.
         Message (str): Notification message.
-        Status (str): Notification status ('Unread', 'Read').
+        Status (NotificationStatus): Notification status ('Unread', 'Read').
         Created_At (datetime): Timestamp of when the notification was created.
         Read_At (Optional[datetime]): Timestamp of when the notification was read.
     """
     Notification_ID: int
-    Recipient_Type: str
+    Recipient_Type: RecipientType
     Recipient_ID: int
     Message: str
-    Status: str = "Unread"
+    Status: NotificationStatus = "Unread"
     Created_At: datetime
-    Read_At: Optional[datetime] = None
+    Read_At: OptDT = None
 
 
-class NotificationCreate(BaseModel):
+class NotificationCreate(CreateModel):
     """
     Schema for creating a new Notification record.
 
     Attributes:
-        Recipient_Type (str): Type of recipient ('Doctor', 'Patient', 'Staff').
+        Recipient_Type (RecipientType): Type of recipient ('Doctor', 'Patient', 'Staff').
         Recipient_ID (int): ID of the recipient.
         Message (str): Notification message.
     """
-    Recipient_Type: str
+    Recipient_Type: RecipientType
     Recipient_ID: int
     Message: str
 
 
-class NotificationRead(NotificationBase):
+class NotificationRead(NotificationBase, ORMModel):
     """
     Schema for reading a Notification record.
 
@@ -464,5 +459,3 @@ class NotificationRead(NotificationBase):
         Notification_ID (int): Unique identifier for the notification.
     """
     Notification_ID: int
-    class Config:
-        from_attributes = True
\ No newline at end of file
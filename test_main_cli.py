@@ -1,9 +1,27 @@
+import contextlib
+import hashlib
+import io
+import os
+import sqlite3
+import tempfile
 import unittest
 from datetime import datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+from database import Base
 from db_operator import get_staff_shift_by_staff_id, create_staff_shift, update_patient, delete_doctor
-from models import StaffShift, Patient, Doctor
-from schemas import StaffShiftCreate, PatientCreate
+from db_operator import commit_once, create_doctor, create_patient, get_patients, get_prescriptions_by
+from db_operator import get_prescriptions_detail_id, get_prescription_with_details, update_prescription_detail
+from db_operator import create_notification_once, create_staff_shift_once, find_doctor_and_patient, mark_notification_as_read
+from db_operator import mark_notifications_as_read, get_notifications_for_recipient
+from db_operator import bulk_create_patients, bulk_create_notifications, get_bed_counts, set_bed_status
+from models import StaffShift, Patient, Doctor, Prescription, PrescriptionDetail, Notification, Ward, Bed
+from schemas import StaffShiftCreate, PatientCreate, DoctorCreate, PrescriptionDetailCreate, NotificationCreate
+from login import loginclass
+from login.loginclass import LoginSystem
+import main_cli
+
 
 class TestDbOperator(unittest.TestCase):
 
@@ -19,7 +37,7 @@ class TestDbOperator(unittest.TestCase):
         ]
 
         # Configure the mock session to return the mock query result
-        db_session.query().filter().all.return_value = mock_shifts
+        db_session.scalars().all.return_value = mock_shifts
 
         # Call the function with the mock session and a staff_id
         result = get_staff_shift_by_staff_id(db_session, 1)
@@ -62,8 +80,8 @@ class TestDbOperator(unittest.TestCase):
 
         # Assert that the result matches the mock staff shift object
         self.assertEqual(result.Staff_ID, 1)
-        self.assertEqual(result.Shift_Start, datetime.strptime('2024-11-01 08:00:00', '%Y-%m-%d %H:%M:%S'))
-        self.assertEqual(result.Shift_End, datetime.strptime('2024-11-01 16:00:00', '%Y-%m-%d %H:%M:%S'))
+        self.assertEqual(result.Shift_Start, datetime.fromisoformat('2024-11-01 08:00:00'))
+        self.assertEqual(result.Shift_End, datetime.fromisoformat('2024-11-01 16:00:00'))
 
     # test UPDATE
     def test_update_patient(self):
@@ -72,24 +90,23 @@ class TestDbOperator(unittest.TestCase):
 
         # Create a mock patient update data
         patient_update_data = PatientCreate(
-            Patient_ID=1,
             Patient_Name='John Smith',
             Patient_Records='Heart Attack',
             Phone_Num='555-123455',
             Email='john.smith@example.com'
         )
 
-        # Create a mock patient object
+        # Create a mock patient object, as returned by UPDATE ... RETURNING
         mock_patient = Patient(
             Patient_ID=1,
-            Patient_Name='John Smith 2',
-            Patient_Records='Heart Attack 2',
+            Patient_Name='John Smith',
+            Patient_Records='Heart Attack',
             Phone_Num='555-123455',
             Email='john.smith@example.com'
         )
 
         # Configure the mock session to return the mock patient object
-        db_session.query().filter().first.return_value = mock_patient
+        db_session.scalars().one_or_none.return_value = mock_patient
 
         # Call the function with the mock session, patient ID, and update data
         result = update_patient(db_session, 1, patient_update_data)
@@ -116,7 +133,7 @@ class TestDbOperator(unittest.TestCase):
         )
 
         # Configure the mock session to return the mock doctor object
-        db_session.query().filter().first.return_value = mock_doctor
+        db_session.get.return_value = mock_doctor
 
         # Call the function with the mock session and doctor ID
         result = delete_doctor(db_session, 1)
@@ -131,7 +148,520 @@ class TestDbOperator(unittest.TestCase):
         # Assert that the delete and commit methods were called
         db_session.delete.assert_called_once_with(mock_doctor)
         db_session.commit.assert_called_once()
-    
+
+
+class TestLoginSystem(unittest.TestCase):
+
+    def setUp(self):
+        # Create a temporary login database with the table logindb.py creates
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, 'login.db')
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+        CREATE TABLE users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password BLOB NOT NULL,
+            salt BLOB,
+            role TEXT NOT NULL
+        )
+        ''')
+        conn.commit()
+        conn.close()
+        self.login_system = self.open_login_system()
+
+    def open_login_system(self):
+        login_system = LoginSystem(db_path=self.db_path)
+        self.addCleanup(login_system.close)
+        return login_system
+
+    def execute(self, sql, params=()):
+        # Run a statement on a separate connection, as another process would
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+            conn.commit()
+            return rows
+        finally:
+            conn.close()
+
+    def stored_row(self, username):
+        return self.execute("SELECT password, salt FROM users WHERE username = ?", (username,))[0]
+
+    def insert_legacy_user(self, username, password, role):
+        # Insert a user the way older versions did: unsalted SHA-256 as a hex string
+        self.execute("INSERT INTO users (username, password, salt, role) VALUES (?, ?, NULL, ?)",
+                     (username, hashlib.sha256(password.encode('utf-8')).hexdigest(), role))
+
+    # test new user
+    def test_register_user_stores_salted_scrypt_hash(self):
+        message = self.login_system.register_user('alice', 'secret', 'doctor')
+        self.assertEqual(message, "User 'alice' successfully registered!")
+
+        # Assert that the password is stored as a salted scrypt digest, not in plain text or SHA-256
+        password, salt = self.stored_row('alice')
+        self.assertEqual(len(salt), 16)
+        self.assertEqual(password, hashlib.scrypt(b'secret', salt=salt, n=2 ** 14, r=8, p=1, dklen=32))
+
+    # test login
+    def test_login_user(self):
+        self.login_system.register_user('alice', 'secret', 'doctor')
+
+        self.assertEqual(self.login_system.login_user('alice', 'secret'), ("Welcome, alice!", 'doctor'))
+        self.assertEqual(self.login_system.login_user('alice', 'wrong'), ("Error: Invalid username or password.", None))
+        self.assertEqual(self.login_system.login_user('bob', 'secret'), ("Error: Invalid username or password.", None))
+
+    # test legacy SHA-256 upgrade
+    def test_login_upgrades_legacy_sha256_hash(self):
+        self.insert_legacy_user('admin', 'admin', 'admin')
+
+        self.assertEqual(self.login_system.login_user('admin', 'wrong'), ("Error: Invalid username or password.", None))
+        self.assertEqual(self.login_system.login_user('admin', 'admin'), ("Welcome, admin!", 'admin'))
+
+        # Assert that the row was rewritten with a salted scrypt hash that still logs in
+        password, salt = self.stored_row('admin')
+        self.assertIsNotNone(salt)
+        self.assertEqual(password, hashlib.scrypt(b'admin', salt=salt, n=2 ** 14, r=8, p=1, dklen=32))
+        self.assertEqual(self.login_system.login_user('admin', 'admin'), ("Welcome, admin!", 'admin'))
+
+    # test constant-time comparison
+    def test_passwords_are_compared_in_constant_time(self):
+        self.login_system.register_user('alice', 'secret', 'doctor')
+        self.insert_legacy_user('legacy', 'legacy', 'staff')
+
+        with patch.object(loginclass.hmac, 'compare_digest', wraps=loginclass.hmac.compare_digest) as compare_digest:
+            # scrypt path
+            self.login_system.login_user('alice', 'secret')
+            self.assertEqual(compare_digest.call_count, 1)
+            # legacy SHA-256 path
+            self.login_system.login_user('legacy', 'legacy')
+            self.assertEqual(compare_digest.call_count, 2)
+
+    # test unknown usernames
+    def test_unknown_username_still_hashes(self):
+        # An unknown username must cost a hash too, so its timing matches a wrong password
+        with patch.object(self.login_system, '_hash_password', wraps=self.login_system._hash_password) as hash_password:
+            self.assertEqual(self.login_system.login_user('nobody', 'secret'), ("Error: Invalid username or password.", None))
+            hash_password.assert_called_once()
+
+    # test change password
+    def test_change_password(self):
+        self.login_system.register_user('alice', 'old', 'staff')
+
+        # A wrong current password is rejected and changes nothing
+        self.assertEqual(self.login_system.change_password('alice', 'wrong', 'new'), "Error: Old password is incorrect.")
+        self.assertEqual(self.login_system.login_user('alice', 'old'), ("Welcome, alice!", 'staff'))
+
+        self.assertEqual(self.login_system.change_password('alice', 'old', 'new'),
+                         "Password for user 'alice' successfully updated!")
+
+        # Assert that the old password stops working and the new one works
+        self.assertEqual(self.login_system.login_user('alice', 'old'), ("Error: Invalid username or password.", None))
+        self.assertEqual(self.login_system.login_user('alice', 'new'), ("Welcome, alice!", 'staff'))
+
+    # test cache invalidation
+    def test_password_changed_by_another_connection(self):
+        self.login_system.register_user('bob', 'pw2', 'staff')
+        # Fill the credential cache
+        self.assertEqual(self.login_system.login_user('bob', 'pw2'), ("Welcome, bob!", 'staff'))
+
+        other = self.open_login_system()
+        self.assertEqual(other.change_password('bob', 'pw2', 'pw3'), "Password for user 'bob' successfully updated!")
+
+        # Assert that the revoked password no longer works through the first connection
+        self.assertEqual(self.login_system.login_user('bob', 'pw2'), ("Error: Invalid username or password.", None))
+        self.assertEqual(self.login_system.login_user('bob', 'pw3'), ("Welcome, bob!", 'staff'))
+
+        # A user deleted elsewhere can no longer log in either
+        self.execute("DELETE FROM users WHERE username = ?", ('bob',))
+        self.assertEqual(self.login_system.login_user('bob', 'pw3'), ("Error: Invalid username or password.", None))
+
+    # test batch registration
+    def test_register_users(self):
+        message = self.login_system.register_users([('ann', 'a1', 'doctor'), ('ben', 'b1', 'staff')])
+        self.assertEqual(message, "2 users successfully registered!")
+        self.assertEqual(self.login_system.login_user('ben', 'b1'), ("Welcome, ben!", 'staff'))
+
+        # Assert that one invalid role rejects the whole batch, as register_user would
+        message = self.login_system.register_users([('cat', 'c1', 'staff'), ('dan', 'd1', 'nurse'), ('eve', 'e1', 'admin')])
+        self.assertEqual(message, "Error: Role 'nurse' is invalid. Valid roles are: admin, doctor, staff")
+        self.assertEqual(self.execute("SELECT username FROM users WHERE username IN ('cat', 'dan', 'eve')"), [])
+
+        # A taken username rejects the whole batch too
+        message = self.login_system.register_users([('fay', 'f1', 'staff'), ('ann', 'a2', 'staff')])
+        self.assertEqual(message, "Error: One or more usernames are already taken; no users were registered.")
+        self.assertEqual(self.login_system.login_user('fay', 'f1'), ("Error: Invalid username or password.", None))
+
+    # test password audit
+    def test_verify_users(self):
+        self.login_system.register_users([('ann', 'a1', 'doctor'), ('ben', 'b1', 'staff')])
+        self.insert_legacy_user('legacy', 'legacy', 'admin')
+
+        matched = self.login_system.verify_users([('ann', 'a1'), ('ben', 'wrong'), ('legacy', 'legacy'), ('nobody', 'x')])
+        self.assertEqual(matched, ['ann', 'legacy'])
+        self.assertEqual(self.login_system.verify_users([]), [])
+
+    # test usernames by role
+    def test_get_usernames_by_role(self):
+        self.login_system.register_users([('zed', 'z1', 'staff'), ('ann', 'a1', 'doctor'), ('ben', 'b1', 'staff')])
+
+        self.assertEqual(self.login_system.get_usernames_by_role('staff'), ['ben', 'zed'])
+        self.assertEqual(self.login_system.get_usernames_by_role('doctor'), ['ann'])
+        self.assertEqual(self.login_system.get_usernames_by_role('admin'), [])
+
+
+class TestDbOperatorSQLite(unittest.TestCase):
+    """Runs the operations against an in-memory SQLite database built from the models."""
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        self.addCleanup(engine.dispose)
+        self.db = Session(engine, expire_on_commit=False)
+        self.addCleanup(self.db.close)
+
+        # Seed one doctor and two patients
+        self.db.add_all([
+            Doctor(Doc_ID=1, Doc_Name='John Smith', Speciality='Cardiology', Email='john.smith@hospital.com'),
+            Patient(Patient_ID=1, Patient_Name='Jane Doe', Patient_Records='Asthma', Email='jane.doe@example.com'),
+            Patient(Patient_ID=2, Patient_Name='Jim Beam', Patient_Records='Flu', Email='jim.beam@example.com'),
+        ])
+        self.db.commit()
+
+    def seed_prescriptions(self):
+        # Prescription 10 has details 100 and 101, prescription 20 has detail 200
+        self.db.add_all([
+            Prescription(Prescription_ID=10, Patient_ID=1, Doctor_ID=1, Notes='first'),
+            Prescription(Prescription_ID=20, Patient_ID=2, Doctor_ID=1, Notes='second'),
+            PrescriptionDetail(Detail_ID=100, Prescription_ID=10, Medication_Name='Aspirin', Dosage='100mg',
+                               Frequency='daily', Duration='7 days'),
+            PrescriptionDetail(Detail_ID=101, Prescription_ID=10, Medication_Name='Ventolin', Dosage='2 puffs',
+                               Frequency='as needed', Duration='30 days'),
+            PrescriptionDetail(Detail_ID=200, Prescription_ID=20, Medication_Name='Tamiflu', Dosage='75mg',
+                               Frequency='twice daily', Duration='5 days'),
+        ])
+        self.db.commit()
+
+    # test get_prescriptions_by
+    def test_get_prescriptions_by(self):
+        self.seed_prescriptions()
+
+        by_prescription = get_prescriptions_by(self.db, 'prescription', 10)
+        self.assertEqual(sorted(row.Medication_Name for row in by_prescription), ['Aspirin', 'Ventolin'])
+        self.assertEqual({(row.Doc_Name, row.Patient_Name) for row in by_prescription}, {('John Smith', 'Jane Doe')})
+
+        by_doctor = get_prescriptions_by(self.db, 'doctor', 1)
+        self.assertEqual(sorted(row.Prescription_ID for row in by_doctor), [10, 10, 20])
+
+        by_patient = get_prescriptions_by(self.db, 'patient', 2)
+        self.assertEqual([(row.Prescription_ID, row.Medication_Name) for row in by_patient], [(20, 'Tamiflu')])
+
+        self.assertEqual(get_prescriptions_by(self.db, 'patient', 99), [])
+
+    def test_get_prescriptions_by_rejects_unknown_lookup(self):
+        # `by` picks a prebuilt statement; anything else must not reach the database
+        for by in ('nurse', 'Prescription.Doctor_ID', "__import__('os')"):
+            with self.assertRaises(KeyError):
+                get_prescriptions_by(self.db, by, 1)
+
+    def count_commits(self):
+        commits = []
+        event.listen(self.db, "after_commit", lambda session: commits.append(session))
+        return commits
+
+    # test commit_once
+    def test_commit_once_commits_nested_creates_once(self):
+        commits = self.count_commits()
+
+        with commit_once(self.db):
+            create_doctor(self.db, DoctorCreate(Doc_Name='Ann Lee', Speciality='Neurology', Email='ann.lee@hospital.com'))
+            with commit_once(self.db):
+                create_patient(self.db, PatientCreate(Patient_Name='Bob Ray', Patient_Records='Migraine',
+                                                      Email='bob.ray@example.com', Doc_ID=1))
+            self.assertEqual(commits, [])
+
+        self.assertEqual(len(commits), 1)
+        self.assertEqual(len(self.db.scalars(select(Doctor)).all()), 2)
+        self.assertEqual(len(self.db.scalars(select(Patient)).all()), 3)
+
+    def test_commit_once_rolls_back_on_error(self):
+        commits = self.count_commits()
+
+        with self.assertRaises(RuntimeError):
+            with commit_once(self.db):
+                create_doctor(self.db, DoctorCreate(Doc_Name='Ann Lee', Speciality='Neurology', Email='ann.lee@hospital.com'))
+                create_patient(self.db, PatientCreate(Patient_Name='Bob Ray', Patient_Records='Migraine',
+                                                      Email='bob.ray@example.com'))
+                raise RuntimeError("fail after the creates")
+
+        # Assert that nothing was committed and both creates were undone
+        self.assertEqual(commits, [])
+        self.assertEqual([doctor.Doc_ID for doctor in self.db.scalars(select(Doctor))], [1])
+        self.assertEqual(len(self.db.scalars(select(Patient)).all()), 2)
+
+        # CRUD calls outside the block commit on their own again
+        create_doctor(self.db, DoctorCreate(Doc_Name='Ann Lee', Speciality='Neurology', Email='ann.lee@hospital.com'))
+        self.assertEqual(len(commits), 1)
+
+    # test keyset pagination
+    def test_get_patients_pages(self):
+        self.db.add_all([
+            Patient(Patient_ID=patient_id, Patient_Name=f'Patient {patient_id}', Patient_Records='Checkup',
+                    Email=f'patient{patient_id}@example.com')
+            for patient_id in (7, 3, 5)
+        ])
+        self.db.commit()
+
+        # Walk the pages by passing the last ID seen as after_id
+        pages = []
+        after_id = 0
+        while True:
+            page = [patient.Patient_ID for patient in get_patients(self.db, after_id=after_id, limit=2)]
+            pages.append(page)
+            if not page:
+                break
+            after_id = page[-1]
+
+        # Assert that the pages are ordered, do not overlap and end with an empty page
+        self.assertEqual(pages, [[1, 2], [3, 5], [7], []])
+        self.assertEqual([patient.Patient_ID for patient in get_patients(self.db, after_id=2, limit=None)], [3, 5, 7])
+
+    # test prescription details by Detail_ID
+    def test_prescription_details_by_detail_id(self):
+        self.seed_prescriptions()
+
+        # Detail IDs differ from the prescription IDs, so a lookup by the wrong key finds nothing
+        self.assertEqual(get_prescriptions_detail_id(self.db, 101).Medication_Name, 'Ventolin')
+        self.assertEqual(get_prescriptions_detail_id(self.db, 200).Prescription_ID, 20)
+        self.assertIsNone(get_prescriptions_detail_id(self.db, 10))
+
+        # Assert that only the addressed detail of prescription 10 is updated
+        updated = update_prescription_detail(self.db, 101, PrescriptionDetailCreate(
+            Prescription_ID=10, Medication_Name='Ventolin', Dosage='4 puffs', Frequency='as needed', Duration='30 days'))
+        self.assertEqual((updated.Detail_ID, updated.Dosage), (101, '4 puffs'))
+        self.assertIsNone(update_prescription_detail(self.db, 10, PrescriptionDetailCreate(
+            Prescription_ID=10, Medication_Name='X', Dosage='X', Frequency='X', Duration='X')))
+
+        prescription = get_prescription_with_details(self.db, 10)
+        self.assertEqual({detail.Detail_ID: detail.Dosage for detail in prescription.details},
+                         {100: '100mg', 101: '4 puffs'})
+        self.assertIsNone(get_prescription_with_details(self.db, 99))
+
+    # test idempotent creates
+    def test_create_notification_once(self):
+        notification = NotificationCreate(Recipient_Type='Patient', Recipient_ID=1, Message='Your results are ready')
+
+        created = create_notification_once(self.db, notification)
+        self.assertEqual((created.Recipient_ID, created.Status), (1, 'Unread'))
+
+        # Assert that a retry of the same unread message is a no-op
+        self.assertIsNone(create_notification_once(self.db, notification))
+        self.assertEqual(len(self.db.scalars(select(Notification)).all()), 1)
+
+        # Once read, the same message can be sent again
+        mark_notification_as_read(self.db, created.Notification_ID)
+        self.assertIsNotNone(create_notification_once(self.db, notification))
+
+    def test_create_staff_shift_once(self):
+        shift = StaffShiftCreate(Staff_ID=1, Shift_Start='2024-11-01 08:00:00', Shift_End='2024-11-01 16:00:00')
+
+        self.assertIsNotNone(create_staff_shift_once(self.db, shift))
+        self.assertIsNone(create_staff_shift_once(self.db, shift))
+        self.assertEqual(len(self.db.scalars(select(StaffShift)).all()), 1)
+
+    # test marking notifications as read
+    def test_mark_notification_as_read_refreshes_loaded_object(self):
+        created = create_notification_once(self.db, NotificationCreate(
+            Recipient_Type='Patient', Recipient_ID=1, Message='Your results are ready'))
+        # The notification stays loaded in the session, as it does across CLI actions
+        self.assertEqual(created.Status, 'Unread')
+
+        updated = mark_notification_as_read(self.db, created.Notification_ID)
+
+        # Assert that both the returned and the already loaded object read as Read
+        self.assertIs(updated, created)
+        self.assertEqual(updated.Status, 'Read')
+        self.assertIsNotNone(updated.Read_At)
+
+        # Marking it again is a no-op
+        self.assertIsNone(mark_notification_as_read(self.db, created.Notification_ID))
+
+    def test_mark_notifications_as_read(self):
+        for message in ('First', 'Second', 'Third'):
+            create_notification_once(self.db, NotificationCreate(Recipient_Type='Staff', Recipient_ID=1, Message=message))
+        loaded = get_notifications_for_recipient(self.db, 'Staff', 1)
+        self.assertEqual([notification.Status for notification in loaded], ['Unread'] * 3)
+
+        self.assertEqual(mark_notifications_as_read(self.db, [loaded[0].Notification_ID, loaded[2].Notification_ID, 99]), 2)
+        self.assertEqual(mark_notifications_as_read(self.db, []), 0)
+
+        # Assert that the loaded objects reflect the update, not the state they were loaded with
+        self.assertEqual([notification.Status for notification in loaded], ['Read', 'Unread', 'Read'])
+        statuses = {notification.Notification_ID: notification.Status
+                    for notification in get_notifications_for_recipient(self.db, 'Staff', 1)}
+        self.assertEqual(statuses, {notification.Notification_ID: notification.Status for notification in loaded})
+        self.assertIsNone(loaded[1].Read_At)
+
+    # test bulk creates
+    def test_bulk_create_returns_rows_in_input_order(self):
+        names = ['Zoe Zed', 'Amy Ash', 'Max Moe']
+        patients = bulk_create_patients(self.db, [
+            PatientCreate(Patient_Name=name, Patient_Records='Checkup', Email=f'{name.split()[0].lower()}@example.com')
+            for name in names
+        ])
+
+        # Assert that the rows come back in input order with their new primary keys
+        self.assertEqual([patient.Patient_Name for patient in patients], names)
+        self.assertEqual([patient.Patient_ID for patient in patients], [3, 4, 5])
+        self.assertEqual([patient.Patient_Name for patient in get_patients(self.db, after_id=2)], names)
+
+        notifications = bulk_create_notifications(self.db, [
+            NotificationCreate(Recipient_Type='Patient', Recipient_ID=patient.Patient_ID, Message='Welcome')
+            for patient in reversed(patients)
+        ])
+        self.assertEqual([notification.Recipient_ID for notification in notifications], [5, 4, 3])
+        self.assertTrue(all(notification.Notification_ID for notification in notifications))
+        self.assertEqual({notification.Status for notification in notifications}, {'Unread'})
+
+        self.assertEqual(bulk_create_patients(self.db, []), [])
+
+    def seed_beds(self):
+        # Ward 1 has beds 1-3 available and bed 4 occupied by patient 1
+        self.db.add_all([Ward(Ward_ID=1, Ward_Name='General', Capacity=4)] + [
+            Bed(Bed_ID=bed_id, Ward_ID=1, Status='Available') for bed_id in (1, 2, 3)
+        ] + [Bed(Bed_ID=4, Ward_ID=1, Status='Occupied', Patient_ID=1, Assigned_Date=datetime(2024, 11, 1, 8, 0))])
+        self.db.commit()
+
+    # test bed counts
+    def test_get_bed_counts(self):
+        self.assertEqual(get_bed_counts(self.db), {})
+
+        self.seed_beds()
+        self.assertEqual(get_bed_counts(self.db), {'Available': 3, 'Occupied': 1})
+
+    # test bed assignment
+    def test_set_bed_status(self):
+        self.seed_beds()
+        assigned_date = datetime(2024, 11, 2, 9, 30)
+
+        # Assert that the returned bed carries the new occupancy columns
+        bed = set_bed_status(self.db, 2, 'Occupied', patient_id=2, assigned_date=assigned_date)
+        self.assertEqual((bed.Bed_ID, bed.Status, bed.Patient_ID, bed.Assigned_Date), (2, 'Occupied', 2, assigned_date))
+
+        # Releasing a bed clears the patient and the assigned date
+        bed = set_bed_status(self.db, 4, 'Available')
+        self.assertEqual((bed.Status, bed.Patient_ID, bed.Assigned_Date), ('Available', None, None))
+        self.assertEqual(get_bed_counts(self.db), {'Available': 3, 'Occupied': 1})
+
+        # An unknown bed changes nothing
+        self.assertIsNone(set_bed_status(self.db, 99, 'Occupied', patient_id=1, assigned_date=assigned_date))
+        self.assertEqual(get_bed_counts(self.db), {'Available': 3, 'Occupied': 1})
+
+    # test find_doctor_and_patient
+    def test_find_doctor_and_patient(self):
+        doctor, patient_found = find_doctor_and_patient(self.db, 1, 2)
+        self.assertEqual((doctor.Doc_ID, doctor.Doc_Name, patient_found), (1, 'John Smith', True))
+
+        # An unknown doctor still yields one row, with the patient flag set
+        self.assertEqual(find_doctor_and_patient(self.db, 99, 1), (None, True))
+
+        doctor, patient_found = find_doctor_and_patient(self.db, 1, 99)
+        self.assertEqual((doctor.Doc_ID, patient_found), (1, False))
+
+        self.assertEqual(find_doctor_and_patient(self.db, 99, 99), (None, False))
+
+
+class TestPrintTable(unittest.TestCase):
+
+    def setUp(self):
+        self.doctors = [Doctor(Doc_ID=doc_id, Doc_Name=f'Doctor {doc_id}', Speciality='Cardiology', Phone_Num=None,
+                               Email=f'doctor{doc_id}@hospital.com') for doc_id in range(1, 6)]
+
+    def run_printer(self, printer, *args, answers=('',)):
+        # Capture what a printer writes and the prompts it shows
+        answers = iter(answers)
+        prompts = []
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), \
+                patch('builtins.input', side_effect=lambda prompt: prompts.append(prompt) or next(answers, '')):
+            printer(*args)
+        return stdout.getvalue(), prompts
+
+    # test short listings
+    def test_print_table_short_result(self):
+        output, prompts = self.run_printer(main_cli.print_table, self.doctors[:2])
+
+        # Assert that short listings keep the boxed layout
+        lines = output.splitlines()
+        self.assertTrue(lines[0].startswith('+-'))
+        self.assertIn('Doc_Name', lines[1])
+        self.assertEqual(sum('Doctor ' in line for line in lines), 2)
+        self.assertEqual(prompts, ["Press Enter to return to the menu..."])
+
+    # test long listings
+    def test_print_table_over_threshold_is_compact(self):
+        with patch.object(main_cli, 'COMPACT_TABLE_ROWS', 4):
+            output, _ = self.run_printer(main_cli.print_table, self.doctors)
+
+        # Assert that long listings drop the box borders for the markdown layout
+        lines = output.splitlines()
+        self.assertFalse(any(line.startswith('+') for line in lines))
+        self.assertTrue(lines[0].startswith('|') and 'Doc_Name' in lines[0])
+        self.assertTrue(set(lines[1]) <= set('|:- '))
+        self.assertEqual(len(lines), 2 + len(self.doctors))
+
+    # test paging
+    def test_print_table_paged(self):
+        output, prompts = self.run_printer(main_cli.print_table_paged, self.doctors, 2)
+
+        # Three pages of 2, 2 and 1 rows; only full pages ask to continue
+        self.assertEqual(output.count('Doc_Name'), 3)
+        self.assertEqual(sum('Doctor ' in line for line in output.splitlines()), 5)
+        self.assertEqual(prompts, ["[Enter]=next / q=quit: "] * 2 + ["Press Enter to return to the menu..."])
+
+        # Quitting stops after the page on screen
+        output, prompts = self.run_printer(main_cli.print_table_paged, self.doctors, 2, answers=('q',))
+        self.assertEqual(sum('Doctor ' in line for line in output.splitlines()), 2)
+        self.assertEqual(prompts, ["[Enter]=next / q=quit: "])
+
+
+class TestLoadHelpData(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'help_qa.json')
+        self.addCleanup(main_cli._help_cache.pop, self.path, None)
+
+    def write_help(self, category, mtime_ns):
+        with open(self.path, 'w') as file:
+            file.write('{"questions": [{"category": "%s", "questions": '
+                       '[{"question": "How many doctors?", "query": "SELECT COUNT(*) FROM Doctors"}]}]}' % category)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    # test help file cache
+    def test_help_file_is_reread_only_after_mtime_changes(self):
+        self.write_help('Doctors', 1_000_000_000)
+
+        with patch.object(main_cli.orjson, 'loads', wraps=main_cli.orjson.loads) as loads:
+            data = main_cli.load_help_data(self.path)
+            self.assertEqual(data['_menu_text'], '1. Doctors')
+            self.assertIs(main_cli.load_help_data(self.path), data)
+            self.assertEqual(loads.call_count, 1)
+
+            # Assert that an edit with the same mtime is not picked up
+            self.write_help('Patients', 1_000_000_000)
+            self.assertIs(main_cli.load_help_data(self.path), data)
+            self.assertEqual(loads.call_count, 1)
+
+            # A new mtime re-reads the file
+            self.write_help('Patients', 2_000_000_000)
+            data = main_cli.load_help_data(self.path)
+            self.assertEqual(data['_menu_text'], '1. Patients')
+            self.assertEqual(loads.call_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
 